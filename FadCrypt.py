@@ -102,11 +102,9 @@ if '--cleanup' in sys.argv:
             # Restore permissions for disabled tools
             if tools_to_restore:
                 print(f"[CLEANUP] Restoring {len(tools_to_restore)} disabled tools...", flush=True)
-                chmod_commands = [f'chmod 755 "{tool}"' for tool in tools_to_restore]
-                full_command = ' && '.join(chmod_commands)
-                
-                # Direct chmod (prerm script runs with root)
-                result = subprocess.run(['bash', '-c', full_command], 
+                # Direct chmod (prerm script runs with root) - one process for all
+                # tools, argv passed straight through so quotes in paths are safe
+                result = subprocess.run(['chmod', '755', *tools_to_restore],
                                       capture_output=True, 
                                       text=True,
                                       check=False)
@@ -192,17 +190,16 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Only QApplication is needed before the splash is on screen; everything
+# else is imported after its first paint (see main()/_post_paint_init)
 try:
     from PyQt6.QtWidgets import QApplication
-    from PyQt6.QtCore import Qt, QTimer
 except ImportError as e:
     print("❌ PyQt6 is not installed!")
     print("📦 Install with: pip install PyQt6")
     print(f"   Error: {e}")
     sys.exit(1)
 
-from version import __version__, __version_code__
-
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
@@ -216,6 +213,17 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 
+# Resolved once at import - platform.system() is not free and main() needs it twice
+_SYSTEM = platform.system()
+
+# Platform -> (module, class) of its main window; imported on demand
+_WINDOW_FACTORIES = {
+    'Linux': ('ui.linux.main_window_linux', 'MainWindowLinux'),
+    'Windows': ('ui.windows.main_window_windows', 'MainWindowWindows'),
+}
+_FALLBACK_WINDOW = ('ui.base.main_window_base', 'MainWindowBase')
+
+
 def get_main_window_class(force_windows=False):
     """
     Detect platform and return appropriate main window class.
@@ -226,25 +234,20 @@ def get_main_window_class(force_windows=False):
     Returns:
         MainWindowLinux or MainWindowWindows depending on platform
     """
-    system = platform.system()
+    import importlib
     
     # Force Windows UI if mock mode is enabled
     if force_windows:
-        print("🧪 [MOCK] Forcing Windows UI (system detected: {})".format(system))
-        from ui.windows.main_window_windows import MainWindowWindows
-        return MainWindowWindows
-    
-    if system == "Linux":
-        from ui.linux.main_window_linux import MainWindowLinux
-        return MainWindowLinux
-    elif system == "Windows":
-        from ui.windows.main_window_windows import MainWindowWindows
-        return MainWindowWindows
+        print("🧪 [MOCK] Forcing Windows UI (system detected: {})".format(_SYSTEM))
+        module_name, class_name = _WINDOW_FACTORIES['Windows']
+    elif _SYSTEM in _WINDOW_FACTORIES:
+        module_name, class_name = _WINDOW_FACTORIES[_SYSTEM]
     else:
         # Fall back to base class for other platforms (macOS, BSD, etc.)
-        print(f"⚠️  Warning: Unsupported platform '{system}', using base implementation")
-        from ui.base.main_window_base import MainWindowBase
-        return MainWindowBase
+        print(f"⚠️  Warning: Unsupported platform '{_SYSTEM}', using base implementation")
+        module_name, class_name = _FALLBACK_WINDOW
+    
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def main():
@@ -257,89 +260,50 @@ def main():
         from win_mock import setup_windows_mocks
         setup_windows_mocks()
     
-    # Detect platform
-    system = platform.system()
-    
     # Step 1: Single Instance Check - Prevent multiple instances
     from core.single_instance_manager import check_single_instance
     single_instance = check_single_instance(exit_if_running=True)
     print("🔒 Single instance lock acquired - no other FadCrypt instances running")
     
-    # Step 2: Start File Monitor Daemon - Monitors and backs up config files
-    from core.file_monitor import start_file_monitor_daemon
-    
-    # Store reference to prevent garbage collection
+    # Store references to prevent garbage collection
     _file_monitor = None
+    window = None
     
     # Create QApplication instance
     app = QApplication(sys.argv)
     app.setApplicationName("FadCrypt")
-    app.setApplicationVersion(__version__)
     
     # Note: High DPI scaling is automatic in Qt6, no need to set attributes
     
-    # Show splash screen
+    # Show splash screen (paints its first frame before returning)
     from ui.components.splash_screen import FadCryptSplashScreen
     splash = FadCryptSplashScreen(resource_path)
     splash.show_message("Initializing FadCrypt...")
     
+    from PyQt6.QtCore import QTimer
+    from version import __version__, __version_code__
+    app.setApplicationVersion(__version__)
+    
     print(f"✅ FadCrypt v{__version__} starting...")
     print(f"🔢 Version Code: {__version_code__}")
     print(f"🎨 UI Framework: PyQt6")
-    print(f"💻 Platform: {system}")
+    print(f"💻 Platform: {_SYSTEM}")
     if mock_windows:
         print(f"🧪 Mock Mode: Windows UI on Linux")
     print(f"📁 Project Root: {project_root}")
     
-    # Get platform-specific window class
-    splash.show_message("Loading platform modules...")
-    MainWindowClass = get_main_window_class(force_windows=mock_windows)
-    
-    # Create main window (but don't show yet)
-    splash.show_message("Creating main window...")
-    window = MainWindowClass(version=__version__)
-    
-    # Setup Ctrl+C signal handler for graceful shutdown after window is created
-    # This allows us to access window._force_quit flag
-    def signal_handler(sig, frame):
-        print("\n🛑 Ctrl+C detected - Shutting down gracefully...")
-        window._force_quit = True  # Set flag to bypass minimize-to-tray
-        QTimer.singleShot(0, app.quit)  # Schedule quit on next event loop iteration
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    
-    # Make Python check for signals by installing a very low-overhead timer
-    # This only wakes up the event loop, doesn't execute heavy code
-    signal_check_timer = QTimer()
-    signal_check_timer.start(100)  # 100ms is sufficient and barely noticeable
-    signal_check_timer.timeout.connect(lambda: None)  # Empty slot - just processes signals
-    
-    # Close splash and show main window with proper centering
-    # Splash will display for 2.5 seconds - quick but visible
-    splash.show_message("Starting application...")
-    splash.close_splash(window, delay_ms=2500)
-    
     # Check for --auto-monitor flag (startup autostart mode)
     auto_monitor_mode = '--auto-monitor' in sys.argv
     
-    if auto_monitor_mode:
-        print("🚀 Auto-monitor mode detected - will start monitoring automatically (silent mode)")
-        # Pass flag to window so it knows to skip dialogs
-        window.auto_monitor_mode = True
-    else:
-        window.auto_monitor_mode = False
-    
-    # NOW check for crash recovery (after auto_monitor_mode flag is set)
-    window.check_crash_recovery()
-    
     # Show window after splash closes
     def show_window():
         window.show()
-        # Re-center after window is fully rendered
-        QTimer.singleShot(100, window.center_on_screen)
+        # Re-center on the next event loop iteration, once the window is mapped
+        QTimer.singleShot(0, window.center_on_screen)
         
         # Start file monitor for config protection
         # This monitors config files and auto-restores them if deleted
+        from core.file_monitor import start_file_monitor_daemon
         nonlocal _file_monitor
         _file_monitor = start_file_monitor_daemon(
             config_folder_func=window.get_fadcrypt_folder,
@@ -354,7 +318,52 @@ def main():
             print("🔄 Starting automatic monitoring...")
             QTimer.singleShot(500, window.on_start_monitoring)  # Start monitoring after 500ms
     
-    QTimer.singleShot(2550, show_window)  # Show window 50ms after splash closes
+    # Heavy platform modules (main window, managers, crypto) are imported
+    # from the event loop so the splash is already visible while they load
+    def _post_paint_init():
+        nonlocal window
+        
+        # Get platform-specific window class
+        splash.show_message("Loading platform modules...")
+        MainWindowClass = get_main_window_class(force_windows=mock_windows)
+        
+        # Create main window (but don't show yet)
+        splash.show_message("Creating main window...")
+        window = MainWindowClass(version=__version__)
+        
+        # Close splash and show main window with proper centering
+        # Splash will display for 2.5 seconds - quick but visible
+        splash.show_message("Starting application...")
+        splash.finished.connect(show_window)
+        splash.close_splash(delay_ms=2500)
+        
+        if auto_monitor_mode:
+            print("🚀 Auto-monitor mode detected - will start monitoring automatically (silent mode)")
+            # Pass flag to window so it knows to skip dialogs
+            window.auto_monitor_mode = True
+        else:
+            window.auto_monitor_mode = False
+        
+        # NOW check for crash recovery (after auto_monitor_mode flag is set)
+        window.check_crash_recovery()
+    
+    # Setup Ctrl+C signal handler for graceful shutdown
+    # Uses window._force_quit flag once the window exists
+    def signal_handler(sig, frame):
+        print("\n🛑 Ctrl+C detected - Shutting down gracefully...")
+        if window is not None:
+            window._force_quit = True  # Set flag to bypass minimize-to-tray
+        QTimer.singleShot(0, app.quit)  # Schedule quit on next event loop iteration
+    
+    signal.signal(signal.SIGINT, signal_handler)
+    
+    # Make Python check for signals by installing a very low-overhead timer
+    # This only wakes up the event loop, doesn't execute heavy code
+    signal_check_timer = QTimer()
+    signal_check_timer.start(100)  # 100ms is sufficient and barely noticeable
+    signal_check_timer.timeout.connect(lambda: None)  # Empty slot - just processes signals
+    
+    QTimer.singleShot(0, _post_paint_init)
     
     # Start event loop
     sys.exit(app.exec())
@@ -4,6 +4,15 @@ import sys
 
 block_cipher = None
 
+# Bytecode compiled with -OO (asserts and docstrings stripped) so the frozen
+# app doesn't carry or unmarshal them. Analysis(optimize=...) needs PyInstaller 6.6+
+from PyInstaller import __version__ as pyinstaller_version
+optimize_options = (
+    {'optimize': 2}
+    if tuple(int(part) for part in pyinstaller_version.split('.')[:2]) >= (6, 6)
+    else {}
+)
+
 a = Analysis(
     ['FadCrypt.py'],
     pathex=[],
@@ -25,10 +34,14 @@ a = Analysis(
         'core.autostart_manager',
         'core.config_manager',
         'core.crypto_manager',
+        'core.json_utils',
         'core.password_manager',
         'core.unified_monitor',
         'core.snake_game',
         'ui.base.main_window_base',
+        # Loaded via importlib by FadCrypt.get_main_window_class
+        'ui.windows',
+        'ui.windows.main_window_windows',
         'ui.components.splash_screen',
         'ui.components.system_tray',
         'ui.components.about_panel',
@@ -49,11 +62,16 @@ a = Analysis(
         'tkinterdnd2',
         'matplotlib',
         'numpy',
+        # Linux-only backends. This platform's main window is imported via
+        # importlib, so it must stay in hiddenimports and never be listed here
+        'ui.linux',
+        'core.linux',
     ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    **optimize_options,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
@@ -4,6 +4,15 @@ import sys
 
 block_cipher = None
 
+# Bytecode compiled with -OO (asserts and docstrings stripped) so the frozen
+# app doesn't carry or unmarshal them. Analysis(optimize=...) needs PyInstaller 6.6+
+from PyInstaller import __version__ as pyinstaller_version
+optimize_options = (
+    {'optimize': 2}
+    if tuple(int(part) for part in pyinstaller_version.split('.')[:2]) >= (6, 6)
+    else {}
+)
+
 a = Analysis(
     ['FadCrypt.py'],
     pathex=[],
@@ -26,6 +35,7 @@ a = Analysis(
         'core.autostart_manager',
         'core.config_manager',
         'core.crypto_manager',
+        'core.json_utils',
         'core.password_manager',
         'core.snake_game',
         'core.unified_monitor',
@@ -109,11 +119,18 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        # Windows-only backends (ui.windows.enhanced_stats_window is shared and stays).
+        # This platform's main window is imported via importlib, so it must stay
+        # in hiddenimports and never be listed here
+        'ui.windows.main_window_windows',
+        'core.windows',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    **optimize_options,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
@@ -1,30 +1,56 @@
 """
 FadCrypt Core Module
 This module contains shared functionality used by both Windows and Linux versions.
+
+Public names are imported lazily on first attribute access (PEP 562), so
+`import core` (or importing a single submodule such as `core.crypto_manager`)
+does not pull in every manager and platform backend up front.
 """
 
-from .config_manager import ConfigManager
-from .application_manager import ApplicationManager
-from .unified_monitor import UnifiedMonitor
-from .crypto_manager import CryptoManager
-from .password_manager import PasswordManager
-from .file_lock_manager import FileLockManager
-from .autostart_manager import (
-    AutostartManagerBase,
-    AutostartManagerLinux,
-    AutostartManagerWindows,
-    get_autostart_manager
-)
-
-__all__ = [
-    'ConfigManager',
-    'ApplicationManager',
-    'UnifiedMonitor',
-    'CryptoManager',
-    'PasswordManager',
-    'FileLockManager',
-    'AutostartManagerBase',
-    'AutostartManagerLinux',
-    'AutostartManagerWindows',
-    'get_autostart_manager',
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Eager imports for type checkers and IDEs only; at runtime these names
+    # resolve through __getattr__ below
+    from .application_manager import ApplicationManager
+    from .autostart_manager import (
+        AutostartManagerBase,
+        AutostartManagerLinux,
+        AutostartManagerWindows,
+        get_autostart_manager,
+    )
+    from .config_manager import ConfigManager
+    from .crypto_manager import CryptoManager
+    from .file_lock_manager import FileLockManager
+    from .password_manager import PasswordManager
+    from .unified_monitor import UnifiedMonitor
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'ConfigManager': '.config_manager',
+    'ApplicationManager': '.application_manager',
+    'UnifiedMonitor': '.unified_monitor',
+    'CryptoManager': '.crypto_manager',
+    'PasswordManager': '.password_manager',
+    'FileLockManager': '.file_lock_manager',
+    'AutostartManagerBase': '.autostart_manager',
+    'AutostartManagerLinux': '.autostart_manager',
+    'AutostartManagerWindows': '.autostart_manager',
+    'get_autostart_manager': '.autostart_manager',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
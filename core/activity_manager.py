@@ -3,27 +3,123 @@ Activity Manager - Tracks all lock/unlock events and security actions
 Append-only audit log for accountability
 """
 
+import atexit
+import csv
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import re
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+
+class ActivityEvent:
+    """A buffered activity log entry, turned into a dict when flushed"""
+    
+    __slots__ = ('ts_ns', 'event_type', 'item_name', 'item_type', 'success',
+                 'duration_locked', 'unlock_method', 'details', 'extra')
+    
+    # Written only when set - readers use .get() with their own defaults
+    OPTIONAL_FIELDS = ('item_name', 'item_type', 'success', 'duration_locked',
+                       'unlock_method', 'details')
+    
+    def __init__(self, ts_ns: int, event_type: str, item_name: Optional[str] = None,
+                 item_type: Optional[str] = None, success: bool = True,
+                 duration_locked: Optional[str] = None, unlock_method: Optional[str] = None,
+                 details: Optional[str] = None, extra: Optional[Dict] = None):
+        self.ts_ns = ts_ns
+        self.event_type = event_type
+        self.item_name = item_name
+        self.item_type = item_type
+        self.success = success
+        self.duration_locked = duration_locked
+        self.unlock_method = unlock_method
+        self.details = details
+        self.extra = extra  # Additional **kwargs fields, None when there are none
+    
+    def to_dict(self, timestamp: str) -> Dict:
+        """Build the JSON object written to the activity log"""
+        event = {'timestamp': timestamp, 'event_type': self.event_type}
+        for field in self.OPTIONAL_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                event[field] = value
+        if self.extra:
+            event.update((key, value) for key, value in self.extra.items() if value is not None)
+        return event
 
 
 class ActivityManager:
     """Manages activity logging for audit trail"""
     
-    def __init__(self, config_folder: str):
+    FLUSH_THRESHOLD = 64  # Buffered events that force an immediate flush
+    FLUSH_INTERVAL = 0.5  # Seconds before a partially filled buffer is flushed
+    
+    # Columns written by export_to_csv, matching log_event's fields
+    CSV_FIELDS = ('timestamp', 'event_type', 'item_name', 'item_type', 'success',
+                  'duration_locked', 'unlock_method', 'details')
+    
+    # Shared encoder: compact separators, UTF-8 written as-is
+    _encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+    
+    def __init__(self, config_folder: str, on_flush: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            config_folder: Folder holding activity.log
+            on_flush: Called after buffered events have been written to disk.
+                May be called from a background timer thread.
+        """
         self.config_folder = config_folder
         self.activity_log_file = os.path.join(config_folder, 'activity.log')
         self.max_file_size = 10 * 1024 * 1024  # 10MB before rotation
+        self.on_flush = on_flush
+        
+        # Events are buffered and appended in batches instead of one
+        # open/write/close per event
+        self._buffer = deque()
+        self._lock = threading.Lock()
+        self._flush_timer = None
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp
+        self._ts_cache = (None, '')
+        # Append-only handle kept open between flushes (opened on first flush).
+        # Log size is tracked from our own writes; stat()ed only when opening
+        self._log_file = None
+        self._current_size = 0
+        # Last-resort flush at interpreter exit: disk only, since the
+        # on_flush callback's target (e.g. the GUI) may already be gone
+        atexit.register(self.close, notify=False)
+    
+    def _open_log(self):
+        """Open the activity log for appending and sync the size counter"""
+        self._log_file = open(self.activity_log_file, 'ab', buffering=0)
+        self._current_size = os.fstat(self._log_file.fileno()).st_size
         
     def _rotate_log_if_needed(self):
         """Rotate log file if it exceeds max size"""
-        if os.path.exists(self.activity_log_file):
-            if os.path.getsize(self.activity_log_file) > self.max_file_size:
-                backup_file = f"{self.activity_log_file}.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                os.rename(self.activity_log_file, backup_file)
+        if self._current_size > self.max_file_size:
+            backup_file = f"{self.activity_log_file}.{time.strftime('%Y%m%d_%H%M%S')}"
+            # Close before renaming - Windows can't rename a file we hold open
+            self._log_file.close()
+            try:
+                os.replace(self.activity_log_file, backup_file)
                 print(f"📝 Activity log rotated to {backup_file}")
+            finally:
+                self._open_log()
+    
+    def _format_timestamp(self, ts_ns: int) -> str:
+        """
+        Format a time.time_ns() value like datetime.isoformat() (local time).
+        
+        The seconds part is formatted once per distinct second and reused
+        for every event logged within it.
+        """
+        seconds, micros = divmod(ts_ns // 1000, 1_000_000)
+        cached_seconds, prefix = self._ts_cache
+        if seconds != cached_seconds:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+            self._ts_cache = (seconds, prefix)
+        return f"{prefix}.{micros:06d}"
     
     def log_event(self, event_type: str, item_name: Optional[str] = None, item_type: Optional[str] = None,
                   success: bool = True, duration_locked: Optional[str] = None, 
@@ -42,72 +138,164 @@ class ActivityManager:
             unlock_method: password, recovery_code, admin_override
             details: Additional details
         """
-        self._rotate_log_if_needed()
+        # Only the raw clock is read here; formatting happens at flush time
+        event = ActivityEvent(time.time_ns(), event_type, item_name, item_type, success,
+                              duration_locked, unlock_method, details, kwargs or None)
         
-        event = {
-            'timestamp': datetime.now().isoformat(),
-            'event_type': event_type,
-            'item_name': item_name,
-            'item_type': item_type,
-            'success': success,
-            'duration_locked': duration_locked,
-            'unlock_method': unlock_method,
-            'details': details,
-            **kwargs
-        }
+        with self._lock:
+            self._buffer.append(event)
+            flush_now = len(self._buffer) >= self.FLUSH_THRESHOLD
+            if not flush_now and self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        print(f"📝 Activity logged: {event_type}")
         
-        try:
-            with open(self.activity_log_file, 'a') as f:
-                f.write(json.dumps(event) + '\n')
-            print(f"📝 Activity logged: {event_type}")
-        except Exception as e:
-            print(f"❌ Error logging activity: {e}")
+        if flush_now:
+            self.flush()
+    
+    def flush(self, notify: bool = True):
+        """
+        Write all buffered events to the activity log.
+        
+        Args:
+            notify: Call on_flush after writing
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._buffer:
+                return
+            events = [event.to_dict(self._format_timestamp(event.ts_ns)) for event in self._buffer]
+            self._buffer.clear()
+            
+            try:
+                if self._log_file is None or os.fstat(self._log_file.fileno()).st_nlink == 0:
+                    # Not opened yet, or the log was deleted while we held it
+                    self._open_log()
+                self._rotate_log_if_needed()
+                data = ''.join(self._encoder.encode(event) + '\n' for event in events).encode('utf-8')
+                self._log_file.write(data)
+                self._current_size += len(data)
+            except Exception as e:
+                print(f"❌ Error logging activity: {e}")
+                return
+        
+        if notify and self.on_flush:
+            try:
+                self.on_flush()
+            except Exception as e:
+                print(f"❌ Error in activity flush callback: {e}")
+    
+    def close(self, notify: bool = True):
+        """
+        Flush buffered events and close the activity log handle.
+        
+        Args:
+            notify: Call on_flush if buffered events were written
+        """
+        self.flush(notify)
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+    
+    def _tail_lines(self, n: int, block_size: int = 64 * 1024) -> List[bytes]:
+        """
+        Return the last n non-empty lines of the activity log.
+        
+        Reads backwards from the end of the file in fixed-size blocks, so the
+        cost is proportional to n rather than to the size of the log.
+        """
+        if n <= 0:
+            return []
+        with open(self.activity_log_file, 'rb') as f:
+            position = os.fstat(f.fileno()).st_size
+            blocks = []
+            newlines = 0
+            # n + 1 newlines guarantee n complete lines (the first may be partial).
+            # Newlines are counted per block, so each byte is scanned once
+            while position > 0 and newlines <= n:
+                read_size = min(block_size, position)
+                position -= read_size
+                f.seek(position)
+                block = f.read(read_size)
+                newlines += block.count(b'\n')
+                blocks.append(block)
+        lines = b''.join(reversed(blocks)).splitlines()
+        if position > 0:
+            lines = lines[1:]  # Drop the partial line at the block boundary
+        return [line for line in lines if line.strip()][-n:]
     
     def get_recent_events(self, limit: int = 50) -> List[Dict]:
         """Get most recent events"""
+        self.flush()
         if not os.path.exists(self.activity_log_file):
             return []
         
         try:
-            events = []
-            with open(self.activity_log_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        events.append(json.loads(line))
-            return events[-limit:]  # Last N events
+            return [json.loads(line) for line in self._tail_lines(limit)]  # Last N events
         except Exception as e:
             print(f"❌ Error reading activity log: {e}")
             return []
     
     def get_events_by_type(self, event_type: str) -> List[Dict]:
         """Get all events of specific type"""
-        events = self.get_recent_events(limit=1000)
-        return [e for e in events if e.get('event_type') == event_type]
+        self.flush()
+        if not os.path.exists(self.activity_log_file):
+            return []
+        
+        # Matches the serialized "event_type" member (with or without the space
+        # older versions wrote after the colon), so only those lines are parsed
+        type_json = self._encoder.encode(event_type).encode('utf-8')
+        pattern = re.compile(rb'"event_type":\s*' + re.escape(type_json))
+        try:
+            return [e for e in (json.loads(line) for line in self._tail_lines(1000)
+                                if pattern.search(line))
+                    if e.get('event_type') == event_type]
+        except Exception as e:
+            print(f"❌ Error reading activity log: {e}")
+            return []
     
     def search_events(self, query: str) -> List[Dict]:
         """Search events by item name or details"""
-        events = self.get_recent_events(limit=1000)
+        self.flush()
+        if not os.path.exists(self.activity_log_file):
+            return []
+        
         query_lower = query.lower()
-        return [e for e in events if 
-                (e.get('item_name', '').lower().find(query_lower) >= 0 or
-                 e.get('details', '').lower().find(query_lower) >= 0)]
+        # Lines that don't contain the query anywhere are skipped before
+        # json.loads. Only possible when the query is written verbatim in the
+        # JSON text (no escaping for quotes, backslashes or non-ASCII)
+        raw_pattern = None
+        if query.isascii() and query.isprintable() and '"' not in query and '\\' not in query:
+            raw_pattern = re.compile(re.escape(query.encode()), re.IGNORECASE)
+        
+        results = []
+        try:
+            for line in self._tail_lines(1000):
+                if raw_pattern is not None and not raw_pattern.search(line):
+                    continue
+                e = json.loads(line)
+                if (query_lower in (e.get('item_name') or '').lower() or
+                        query_lower in (e.get('details') or '').lower()):
+                    results.append(e)
+        except Exception as e:
+            print(f"❌ Error searching activity log: {e}")
+        return results
     
     def export_to_csv(self, output_file: str) -> bool:
         """Export activity log to CSV"""
-        import csv
         try:
             events = self.get_recent_events(limit=10000)
             if not events:
                 print("No events to export")
                 return False
             
-            keys = set()
-            for event in events:
-                keys.update(event.keys())
-            keys = sorted(list(keys))
-            
             with open(output_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=keys)
+                # Extra **kwargs fields are not part of the export
+                writer = csv.DictWriter(f, fieldnames=self.CSV_FIELDS, extrasaction='ignore')
                 writer.writeheader()
                 writer.writerows(events)
             
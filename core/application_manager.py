@@ -9,31 +9,119 @@ This module handles all application management functionality including:
 - UI components for application list display
 """
 
+import atexit
+import hashlib
 import os
 import json
+import logging
+import queue
+import subprocess
+import threading
 import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from tkinter import ttk, filedialog, messagebox
 from datetime import datetime
-from typing import Callable, Optional, Dict, List, Any
-from PIL import Image, ImageTk
+from typing import Callable, Optional, Dict, List, Any, Tuple
+from PIL import Image, ImageDraw, ImageTk
+
+from core.json_utils import dumps_json, loads_json
+
+
+logger = logging.getLogger(__name__)
+
+
+def _safe_mtime(path: str) -> float:
+    """Modification time of a file, or 0.0 if it can't be stat()ed (e.g. bare command names)"""
+    try:
+        return os.path.getmtime(path)
+    except (OSError, ValueError):
+        return 0.0
+
+
+# Resized icons are kept on disk as raw RGBA so warm starts skip decode + LANCZOS
+ICON_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'fadcrypt', 'icons'
+)
+ICON_CACHE_MAX_ENTRIES = 200  # Least recently used entries beyond this are evicted
+
+# Where .desktop entries are installed (earlier directories take precedence)
+DESKTOP_DIRS = (
+    '/usr/share/applications',
+    '/usr/local/share/applications',
+    os.path.expanduser('~/.local/share/applications'),
+)
+
+# Fixed-size hicolor theme directories searched for app icons
+_HICOLOR_SIZES = (32, 48, 64, 128, 256)
+
+
+@lru_cache(maxsize=None)
+def _hicolor_app_dirs(size: int) -> Tuple[str, ...]:
+    """
+    hicolor app icon directories, best match for size first.
+    
+    An exact match decodes without any resize; after that larger variants
+    (downscaled cleanly) come before smaller ones.
+    """
+    order = sorted(_HICOLOR_SIZES, key=lambda s: (s < size, abs(s - size)))
+    return tuple(f'/usr/share/icons/hicolor/{s}x{s}/apps' for s in order)
+
+
+@lru_cache(maxsize=None)
+def _icon_name_locations(size: int) -> Tuple[Tuple[str, str], ...]:
+    """(directory, extension) pairs searched by find_icon_by_name, in order"""
+    return (
+        ('/usr/share/pixmaps', '.png'),
+        ('/usr/share/pixmaps', '.xpm'),
+        *((directory, '.png') for directory in _hicolor_app_dirs(size)),
+        ('/usr/share/icons/hicolor/scalable/apps', '.svg'),
+        ('/usr/share/app-install/icons', '.png'),
+    )
+
+
+@lru_cache(maxsize=None)
+def _icon_path_dirs(size: int) -> Tuple[str, ...]:
+    """Directories searched by find_icon_path, in order"""
+    return (*_hicolor_app_dirs(size), '/usr/share/pixmaps', '/usr/share/icons')
+
+
+# Extensions find_icon_path tries for a bare icon name
+_ICON_PATH_EXTENSIONS = ('.png', '.svg', '.xpm', '')
+
+
+# Ordinal suffix for each day of the month (index 0 unused)
+_ORDINAL_SUFFIXES = tuple(
+    "th" if day == 0 or 4 <= day <= 20 or 24 <= day <= 30 else ["st", "nd", "rd"][day % 10 - 1]
+    for day in range(32)
+)
+_MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
 
 
 def format_timestamp(timestamp: float) -> str:
     """
-    Format timestamp to readable format: '24th Aug 2025 2:24 PM'
+    Format timestamp to readable format: '24th Aug 2025 02:24 PM'
+    
+    The output only goes down to the minute, so results are memoized per
+    minute: timestamps never change once written, and the same ones are
+    formatted every time the edit dialog or statistics are shown.
     """
-    dt = datetime.fromtimestamp(timestamp)
+    return _format_minute(int(timestamp // 60))
+
+
+@lru_cache(maxsize=4096)
+def _format_minute(minute: int) -> str:
+    """format_timestamp for a timestamp truncated to whole minutes since the epoch"""
+    dt = datetime.fromtimestamp(minute * 60)
     
-    # Get day with ordinal suffix
+    # Format: 24th Aug 2025 02:24 PM (built directly rather than via strftime)
     day = dt.day
-    if 4 <= day <= 20 or 24 <= day <= 30:
-        suffix = "th"
-    else:
-        suffix = ["st", "nd", "rd"][day % 10 - 1]
-    
-    # Format: 24th Aug 2025 2:24 PM
-    return dt.strftime(f"{day}{suffix} %b %Y %I:%M %p")
+    hour = dt.hour % 12 or 12
+    meridiem = 'AM' if dt.hour < 12 else 'PM'
+    return f"{day}{_ORDINAL_SUFFIXES[day]} {_MONTH_ABBR[dt.month - 1]} {dt.year} {hour:02d}:{dt.minute:02d} {meridiem}"
 
 
 class ApplicationManager:
@@ -42,6 +130,16 @@ class ApplicationManager:
     Handles the applications tab, edit dialogs, statistics, and metadata.
     """
     
+    METADATA_FLUSH_DELAY_MS = 500  # Debounce window for metadata writes
+    ICON_POLL_INTERVAL_MS = 30  # How often decoded icons are picked up by the Tk thread
+    ICON_NEGATIVE_CACHE_SIZE = 1024  # App paths remembered as having no icon
+    ICON_MEMORY_CACHE_SIZE = 256  # PhotoImages kept in icon_cache (least recently used evicted)
+    CARD_COLUMNS = 3  # Number of cards per row
+    CARD_ROW_HEIGHT = 190  # Height of one grid row (card plus padding)
+    CARD_PADDING = 10  # Gap around each card inside its grid cell
+    CARD_BINDTAG = 'FadCryptAppCard'  # Bind tag shared by every widget of every card
+    CARD_NAME_MAX_CHARS = 22  # Longer names are truncated so they fit on one line
+    
     def __init__(self, app_locker, master, notebook, resource_path_func, 
                  show_message_func, update_config_display_func, is_linux=True):
         """
@@ -69,14 +167,56 @@ class ApplicationManager:
         self.apps_frame = None
         self.apps_container = None  # Scrollable container for grid
         self.apps_canvas = None  # Canvas for scrolling
-        self.selected_apps = []  # Track selected application cards
+        # Names of selected applications; a dict used as an insertion-ordered set,
+        # so membership is O(1) and the first selected app stays first
+        self.selected_apps: Dict[str, None] = {}
         self.app_cards = []  # Store card widgets for selection
         self.selected_cards = set()  # Track selected cards
-        self.app_count_label = None
-        self.apps_frame = None
-        
-        # Icon cache
-        self.icon_cache = {}
+        # Only the cards in view exist as placed widgets: app index -> card, plus
+        # a pool of hidden cards that get rebound as the view scrolls
+        self._visible_cards: Dict[int, tk.Frame] = {}
+        self._card_pool: List[tk.Frame] = []
+        self._content_height = 0
+        self._empty_label = None
+        self._context_menu = None  # Right-click menu, built on first use
+        self._config_update_pending = False  # update_config_display queued for idle
+        # App name -> index in config["applications"], rebuilt on refresh
+        self._app_index_by_name: Dict[str, int] = {}
+        # Configure events are coalesced into one _do_configure per idle tick
+        self._configure_pending = False
+        self._pending_canvas_width = None
+        self._canvas_height = 0
+        
+        # Icon cache, keyed by (app_path, app mtime, size) so reinstalled apps get a
+        # fresh icon; insertion-ordered for LRU eviction. Labels showing an icon
+        # keep their own reference (label.image), so evicting never blanks one.
+        self.icon_cache: Dict[Tuple[str, float, Tuple[int, int]], ImageTk.PhotoImage] = {}
+        # App paths with no usable icon (insertion-ordered for FIFO eviction)
+        self._icon_negative: Dict[str, None] = {}
+        # Off-thread icon decoding: worker results are queued and turned into
+        # PhotoImages on the Tk thread (Tk is not thread-safe)
+        self._icon_executor = None
+        self._icon_results = queue.Queue()
+        self._icon_pending: Dict[Tuple[str, float, Tuple[int, int]], List[Callable]] = {}
+        self._icon_poll_scheduled = False
+        self._fallback_icon = None  # Shared placeholder PhotoImage, see _get_fallback_icon
+        # Icon directory -> set of file names, so lookups don't stat() each candidate
+        self._icon_dir_cache: Dict[str, set] = {}
+        # (normalized app name, size) -> find_icon_by_name result (None included)
+        self._find_icon_by_name_cache: Dict[Tuple[str, int], Optional[str]] = {}
+        # (icon name, size) -> find_icon_path result (None included)
+        self._find_icon_path_cache: Dict[Tuple[str, int], Optional[str]] = {}
+        # Exec basename/path -> (desktop file, Icon= value), built by the first icon
+        # worker that needs it. Dropped on the Tk thread (refresh_desktop_index,
+        # or update_apps_listbox when a desktop directory's mtime changes)
+        self._desktop_index: Optional[Dict[str, Tuple[str, str]]] = None
+        self._desktop_index_mtimes: Optional[Tuple[Optional[int], ...]] = None
+        self._desktop_index_generation = 0  # Bumped on every refresh
+        # Only one worker builds the index; the others wait for it
+        self._desktop_index_build_lock = threading.Lock()
+        # Guards the lookup caches above, the index and its generation
+        # (shared by the icon worker threads and the Tk thread)
+        self._icon_lookup_lock = threading.Lock()
         
         # Callback for adding applications (set by parent GUI)
         self.add_application_callback = None
@@ -88,6 +228,18 @@ class ApplicationManager:
         )
         self.metadata = self.load_metadata()
         
+        # Unlock stats live in flat name -> value dicts on the hot path and are
+        # folded into self.metadata when it is read or flushed
+        self._unlock_counts = {name: meta.get('unlock_count', 0) for name, meta in self.metadata.items()}
+        self._last_unlocked = {name: meta.get('last_unlocked') for name, meta in self.metadata.items()}
+        self._counters_dirty = set()
+        
+        # Metadata changes are coalesced and written at most once per
+        # METADATA_FLUSH_DELAY_MS instead of on every update
+        self._metadata_dirty = False
+        self._flush_scheduled = False
+        atexit.register(self._flush_metadata)
+        
         # Create the Applications tab
         self.create_applications_tab()
     
@@ -95,23 +247,64 @@ class ApplicationManager:
         """Load application metadata (timestamps, stats) from file"""
         if os.path.exists(self.metadata_file):
             try:
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
+                with open(self.metadata_file, 'rb') as f:
+                    return loads_json(f.read())
             except Exception as e:
                 print(f"Error loading metadata: {e}")
                 return {}
         return {}
     
     def save_metadata(self):
-        """Save application metadata to file"""
+        """Mark metadata as changed and schedule a batched write to file"""
+        self._metadata_dirty = True
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.master.after(self.METADATA_FLUSH_DELAY_MS, self._flush_metadata)
+    
+    def _flush_metadata(self):
+        """Write pending metadata changes to file (atomically via a temp file)"""
+        self._flush_scheduled = False
+        if not self._metadata_dirty:
+            return
+        self._fold_counters()
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=4)
+            tmp_file = self.metadata_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(dumps_json(self.metadata, indent=True))
+                # Make sure the data is on disk before the rename makes it current
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.metadata_file)
+            self._metadata_dirty = False
         except Exception as e:
             print(f"Error saving metadata: {e}")
     
+    def _fold_counters(self):
+        """Copy changed unlock counters into their metadata entries"""
+        for app_name in self._counters_dirty:
+            meta = self.metadata.get(app_name)
+            if meta is None:
+                meta = self.metadata[app_name] = {
+                    'added_timestamp': time.time(),
+                    'modified_timestamp': time.time(),
+                }
+            meta['unlock_count'] = self._unlock_counts[app_name]
+            meta['last_unlocked'] = self._last_unlocked[app_name]
+        self._counters_dirty.clear()
+    
+    def _move_counters(self, old_name: str, new_name: Optional[str] = None):
+        """Move (or with new_name=None, drop) an app's unlock counters after a rename/removal"""
+        self._counters_dirty.discard(old_name)
+        count = self._unlock_counts.pop(old_name, 0)
+        last_unlocked = self._last_unlocked.pop(old_name, None)
+        if new_name is not None:
+            self._unlock_counts[new_name] = count
+            self._last_unlocked[new_name] = last_unlocked
+    
     def get_app_metadata(self, app_name: str) -> Dict:
         """Get metadata for a specific app, create if doesn't exist"""
+        if self._counters_dirty:
+            self._fold_counters()
         if app_name not in self.metadata:
             self.metadata[app_name] = {
                 'added_timestamp': time.time(),
@@ -122,11 +315,26 @@ class ApplicationManager:
             self.save_metadata()
         return self.metadata[app_name]
     
+    def _ensure_metadata(self, applications: List[Dict]):
+        """Create metadata for apps that have none, with a single save for all of them"""
+        now = None
+        for app in applications:
+            if app['name'] not in self.metadata:
+                now = now or time.time()
+                self.metadata[app['name']] = {
+                    'added_timestamp': now,
+                    'modified_timestamp': now,
+                    'unlock_count': 0,
+                    'last_unlocked': None
+                }
+        if now is not None:
+            self.save_metadata()
+    
     def increment_unlock_count(self, app_name: str):
         """Increment unlock count for an app"""
-        meta = self.get_app_metadata(app_name)
-        meta['unlock_count'] += 1
-        meta['last_unlocked'] = time.time()
+        self._unlock_counts[app_name] = self._unlock_counts.get(app_name, 0) + 1
+        self._last_unlocked[app_name] = time.time()
+        self._counters_dirty.add(app_name)
         self.save_metadata()
     
     def update_modified_timestamp(self, app_name: str):
@@ -140,164 +348,472 @@ class ApplicationManager:
         Get icon for an application.
         Returns cached icon if available, otherwise tries to extract/load icon.
         """
-        print(f"\n🔍 [ICON LOADING] Attempting to load icon for: {app_path}")
+        logger.debug("[ICON LOADING] Attempting to load icon for: %s", app_path)
+        
+        key = (app_path, _safe_mtime(app_path), tuple(size))
+        photo = self._get_cached_photo(key)
+        if photo is not None:
+            logger.debug("[ICON CACHE] Found cached icon for: %s", app_path)
+            return photo
+        if app_path in self._icon_negative:
+            return None
+        
+        image = self._decode_icon(app_path, size)
+        if image is None:
+            self._remember_no_icon(app_path)
+            return None
+        photo = ImageTk.PhotoImage(image)
+        self._cache_photo(key, photo)
+        return photo
+    
+    def load_app_icon_async(self, app_path: str, size, on_ready: Callable[[ImageTk.PhotoImage], None]):
+        """
+        Load an application icon without blocking the UI.
+        
+        The icon is resolved and decoded on a worker thread; on_ready is then
+        called on the Tk thread with the PhotoImage (only if an icon was found).
+        """
+        key = (app_path, _safe_mtime(app_path), tuple(size))
+        photo = self._get_cached_photo(key)
+        if photo is not None:
+            on_ready(photo)
+            return
+        if app_path in self._icon_negative:
+            return
+        
+        callbacks = self._icon_pending.get(key)
+        if callbacks is not None:
+            callbacks.append(on_ready)  # Already being decoded
+            return
+        self._icon_pending[key] = [on_ready]
         
-        if app_path in self.icon_cache:
-            print(f"✅ [ICON CACHE] Found cached icon for: {app_path}")
-            return self.icon_cache[app_path]
+        if self._icon_executor is None:
+            self._icon_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='fadcrypt-icon')
+        future = self._icon_executor.submit(self._decode_icon, app_path, size)
+        future.add_done_callback(lambda f, key=key: self._icon_results.put((key, f)))
+        
+        if not self._icon_poll_scheduled:
+            self._icon_poll_scheduled = True
+            self.master.after(self.ICON_POLL_INTERVAL_MS, self._poll_icon_results)
+    
+    def _poll_icon_results(self):
+        """Build PhotoImages for decoded icons on the Tk thread and run their callbacks"""
+        while True:
+            try:
+                key, future = self._icon_results.get_nowait()
+            except queue.Empty:
+                break
+            
+            callbacks = self._icon_pending.pop(key, [])
+            try:
+                image = future.result()
+            except Exception as e:
+                logger.warning("[ERROR] Error decoding icon for %s: %s", key[0], e)
+                image = None
+            if image is None:
+                self._remember_no_icon(key[0])
+                continue
+            
+            photo = ImageTk.PhotoImage(image)
+            self._cache_photo(key, photo)
+            for callback in callbacks:
+                try:
+                    callback(photo)
+                except tk.TclError:
+                    pass  # Widget was destroyed before its icon arrived
+        
+        if self._icon_pending:
+            self.master.after(self.ICON_POLL_INTERVAL_MS, self._poll_icon_results)
+        else:
+            self._icon_poll_scheduled = False
+    
+    def _get_cached_photo(self, key) -> Optional[ImageTk.PhotoImage]:
+        """Look up icon_cache, marking a hit as most recently used"""
+        photo = self.icon_cache.pop(key, None)
+        if photo is not None:
+            self.icon_cache[key] = photo
+        return photo
+    
+    def _cache_photo(self, key, photo: ImageTk.PhotoImage):
+        """Add a PhotoImage to icon_cache, evicting the least recently used when full"""
+        self.icon_cache[key] = photo
+        if len(self.icon_cache) > self.ICON_MEMORY_CACHE_SIZE:
+            del self.icon_cache[next(iter(self.icon_cache))]
+    
+    def _remember_no_icon(self, app_path: str):
+        """Add an app path to the negative icon cache, evicting the oldest entry when full"""
+        self._icon_negative[app_path] = None
+        if len(self._icon_negative) > self.ICON_NEGATIVE_CACHE_SIZE:
+            del self._icon_negative[next(iter(self._icon_negative))]
+    
+    @staticmethod
+    def _show_icon_on(label: tk.Label) -> Callable[[ImageTk.PhotoImage], None]:
+        """Callback for load_app_icon_async that swaps a placeholder label to the icon"""
+        def on_ready(photo):
+            if label.winfo_exists():
+                label.configure(image=photo, text='')
+                label.image = photo  # Keep reference
+        return on_ready
+    
+    def _get_fallback_icon(self) -> ImageTk.PhotoImage:
+        """
+        Placeholder card icon (a parcel box), drawn once and shared by every card.
+        Showing one image is cheaper than laying out an emoji glyph per card.
+        """
+        if self._fallback_icon is None:
+            image = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(image)
+            draw.rectangle((14, 26, 50, 54), fill='#c8a165', outline='#8a6a3a')  # Body
+            draw.polygon([(10, 17), (54, 17), (50, 26), (14, 26)], fill='#dbb57a', outline='#8a6a3a')  # Lid
+            draw.rectangle((29, 17, 35, 54), fill='#8a6a3a')  # Tape
+            self._fallback_icon = ImageTk.PhotoImage(image)
+        return self._fallback_icon
+    
+    def _decode_icon(self, app_path: str, size) -> Optional[Image.Image]:
+        """
+        Resolve and decode an application icon to a resized RGBA image.
+        Makes no Tk calls, so it can run on a worker thread.
+        """
+        cached_image = self._load_cached_icon(app_path, size)
+        if cached_image is not None:
+            logger.debug("[DISK CACHE] Loaded pre-decoded icon for: %s", app_path)
+            return cached_image
         
         try:
             icon_path = None
             
             # Try to get icon from .desktop file on Linux
             if self.is_linux:
-                print(f"🐧 [LINUX] Searching for .desktop file...")
-                icon_path = self.find_desktop_icon(app_path)
+                logger.debug("[LINUX] Searching for .desktop file...")
+                icon_path = self.find_desktop_icon(app_path, size[0])
                 if icon_path:
-                    print(f"✅ [DESKTOP] Found icon from .desktop file: {icon_path}")
+                    logger.debug("[DESKTOP] Found icon from .desktop file: %s", icon_path)
                 else:
-                    print(f"❌ [DESKTOP] No icon found in .desktop files")
+                    logger.debug("[DESKTOP] No icon found in .desktop files")
             
             # If no icon found, try to find by app name
             if not icon_path or not os.path.exists(icon_path):
                 app_name = os.path.basename(app_path).lower()
-                print(f"🔎 [NAME SEARCH] Searching by app name: {app_name}")
+                logger.debug("[NAME SEARCH] Searching by app name: %s", app_name)
                 # Try common icon locations
-                icon_path = self.find_icon_by_name(app_name)
+                icon_path = self.find_icon_by_name(app_name, size[0])
                 if icon_path:
-                    print(f"✅ [NAME SEARCH] Found icon: {icon_path}")
+                    logger.debug("[NAME SEARCH] Found icon: %s", icon_path)
                 else:
-                    print(f"❌ [NAME SEARCH] No icon found by name")
+                    logger.debug("[NAME SEARCH] No icon found by name")
             
             # Load the icon if found
             if icon_path and os.path.exists(icon_path):
-                print(f"📁 [FILE CHECK] Icon file exists: {icon_path}")
+                logger.debug("[FILE CHECK] Icon file exists: %s", icon_path)
                 # Handle SVG files
                 if icon_path.endswith('.svg'):
-                    print(f"🎨 [SVG] Found SVG file, looking for PNG alternative...")
+                    logger.debug("[SVG] Found SVG file, looking for PNG alternative...")
                     # For SVG, we'll use a default icon or convert
                     # For now, try to find PNG version
                     png_path = icon_path.replace('.svg', '.png')
                     if os.path.exists(png_path):
                         icon_path = png_path
-                        print(f"✅ [SVG->PNG] Using PNG version: {png_path}")
+                        logger.debug("[SVG->PNG] Using PNG version: %s", png_path)
                     else:
                         # Try without extension
-                        icon_path = self.find_icon_by_name(os.path.splitext(os.path.basename(icon_path))[0])
+                        icon_path = self.find_icon_by_name(os.path.splitext(os.path.basename(icon_path))[0], size[0])
                         if icon_path:
-                            print(f"✅ [SVG->PNG] Found alternative: {icon_path}")
+                            logger.debug("[SVG->PNG] Found alternative: %s", icon_path)
                 
                 if icon_path and icon_path.endswith(('.png', '.jpg', '.jpeg', '.xpm')):
-                    print(f"🖼️ [IMAGE LOAD] Loading image file: {icon_path}")
-                    image = Image.open(icon_path)
-                    image = image.resize(size, Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
-                    self.icon_cache[app_path] = photo
-                    print(f"✅ [SUCCESS] Icon loaded and cached successfully!")
-                    return photo
+                    logger.debug("[IMAGE LOAD] Loading image file: %s", icon_path)
+                    image = self._open_icon_image(icon_path, size)
+                    self._store_cached_icon(app_path, size, icon_path, image)
+                    logger.debug("[SUCCESS] Icon loaded and cached successfully!")
+                    return image
                 else:
-                    print(f"⚠️ [FORMAT] Unsupported format or no valid path: {icon_path}")
+                    logger.debug("[FORMAT] Unsupported format or no valid path: %s", icon_path)
             else:
-                print(f"❌ [NOT FOUND] Icon path not found or doesn't exist")
+                logger.debug("[NOT FOUND] Icon path not found or doesn't exist")
         except Exception as e:
-            print(f"❌ [ERROR] Error loading icon for {app_path}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("[ERROR] Error loading icon for %s: %s", app_path, e, exc_info=True)
         
-        print(f"❌ [FINAL] Returning None - no icon loaded for {app_path}")
+        logger.debug("[FINAL] Returning None - no icon loaded for %s", app_path)
+        return None
+    
+    @staticmethod
+    def _open_icon_image(icon_path: str, size) -> Image.Image:
+        """
+        Decode an icon file and resize it to size, shrinking large sources on load.
+        Falls back to a plain full decode for formats the fast path can't handle.
+        """
+        try:
+            image = Image.open(icon_path)
+            if image.size == tuple(size):
+                # Already the right size (only the header has been read so far)
+                return image.convert('RGBA')
+            # JPEG decoders can decode straight to a 1/2-1/8 scale; no-op for other formats
+            image.draft('RGB', size)
+            image = image.convert('RGBA')
+            # reducing_gap shrinks large sources with a cheap box reduce before LANCZOS
+            return image.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+        except (OSError, ValueError) as e:
+            logger.debug("[IMAGE LOAD] Fast decode failed for %s (%s), retrying", icon_path, e)
+            image = Image.open(icon_path).convert('RGBA')
+            return image.resize(size, Image.Resampling.LANCZOS)
+    
+    def _icon_cache_base(self, app_path: str, size) -> str:
+        """Disk cache path (without extension) for an app icon at a given size"""
+        digest = hashlib.sha1(app_path.encode('utf-8', 'surrogateescape')).hexdigest()
+        return os.path.join(ICON_CACHE_DIR, f"{digest}_{size[0]}x{size[1]}")
+    
+    def _load_cached_icon(self, app_path: str, size) -> Optional[Image.Image]:
+        """Load a resized icon from the disk cache if its source file is unchanged"""
+        base = self._icon_cache_base(app_path, size)
+        try:
+            with open(base + '.json', 'r') as f:
+                info = json.load(f)
+            if os.path.getmtime(info['icon_path']) != info['mtime']:
+                return None  # Source icon changed since it was cached
+            if info.get('app_mtime') != _safe_mtime(app_path):
+                return None  # App reinstalled/updated; its icon may have changed too
+            with open(base + '.raw', 'rb') as f:
+                data = f.read()
+            os.utime(base + '.raw')  # Mark as recently used for eviction
+            return Image.frombytes('RGBA', tuple(size), data)
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def _store_cached_icon(self, app_path: str, size, icon_path: str, image: Image.Image):
+        """Write a resized RGBA icon to the disk cache and evict old entries"""
+        base = self._icon_cache_base(app_path, size)
+        try:
+            os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+            with open(base + '.raw', 'wb') as f:
+                f.write(image.tobytes())
+            with open(base + '.json', 'w') as f:
+                json.dump({
+                    'icon_path': icon_path,
+                    'mtime': os.path.getmtime(icon_path),
+                    'app_mtime': _safe_mtime(app_path),
+                }, f)
+            
+            entries = [entry for entry in os.scandir(ICON_CACHE_DIR) if entry.name.endswith('.raw')]
+            if len(entries) > ICON_CACHE_MAX_ENTRIES:
+                entries.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in entries[:len(entries) - ICON_CACHE_MAX_ENTRIES]:
+                    stale_base = entry.path[:-len('.raw')]
+                    for ext in ('.raw', '.json'):
+                        try:
+                            os.remove(stale_base + ext)
+                        except OSError:
+                            pass
+        except OSError as e:
+            logger.warning("[DISK CACHE] Could not cache icon for %s: %s", app_path, e)
+    
+    def _listdir_set(self, directory: str) -> set:
+        """File names in an icon directory (cached; empty set if missing)"""
+        with self._icon_lookup_lock:
+            names = self._icon_dir_cache.get(directory)
+        if names is None:
+            try:
+                # d_type from scandir filters out subdirectories without a stat() each
+                with os.scandir(directory) as it:
+                    names = {entry.name for entry in it if not entry.is_dir()}
+            except OSError:
+                names = set()
+            with self._icon_lookup_lock:
+                self._icon_dir_cache[directory] = names
+        return names
+    
+    def _find_in_icon_dir(self, directory: str, filename: str) -> Optional[str]:
+        """Return directory/filename if the cached listing has it and it still exists"""
+        if filename in self._listdir_set(directory):
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                return path
         return None
     
-    def find_icon_by_name(self, app_name: str) -> Optional[str]:
-        """Find icon by application name in standard icon directories"""
+    def find_icon_by_name(self, app_name: str, size: int = 32) -> Optional[str]:
+        """Find icon by application name in standard icon directories, preferring the given pixel size"""
         # Remove common suffixes
         app_name = app_name.replace('-browser', '').replace('.bin', '').replace('.exe', '')
         
+        cache_key = (app_name, size)
+        with self._icon_lookup_lock:
+            if cache_key in self._find_icon_by_name_cache:
+                return self._find_icon_by_name_cache[cache_key]
+        
         # Common icon directories and sizes
-        icon_locations = [
-            f'/usr/share/pixmaps/{app_name}.png',
-            f'/usr/share/pixmaps/{app_name}.xpm',
-            f'/usr/share/icons/hicolor/48x48/apps/{app_name}.png',
-            f'/usr/share/icons/hicolor/32x32/apps/{app_name}.png',
-            f'/usr/share/icons/hicolor/256x256/apps/{app_name}.png',
-            f'/usr/share/icons/hicolor/scalable/apps/{app_name}.svg',
-            f'/usr/share/app-install/icons/{app_name}.png',
-        ]
-        
-        for path in icon_locations:
-            if os.path.exists(path):
-                return path
+        icon_locations = _icon_name_locations(size)
+        
+        # Try as-is, then with capital first letter
+        found = None
+        for name in (app_name, app_name.capitalize()):
+            for directory, ext in icon_locations:
+                found = self._find_in_icon_dir(directory, name + ext)
+                if found:
+                    break
+            if found:
+                break
         
-        # Try with capital first letter
-        app_name_cap = app_name.capitalize()
-        for path in icon_locations:
-            cap_path = path.replace(app_name, app_name_cap)
-            if os.path.exists(cap_path):
-                return cap_path
+        with self._icon_lookup_lock:
+            self._find_icon_by_name_cache[cache_key] = found
+        return found
+    
+    def _parse_desktop_entry(self, path: str) -> Dict[str, Any]:
+        """
+        Read Name, Exec, Icon and NoDisplay from the [Desktop Entry] section of a .desktop file.
         
-        return None
+        Stops as soon as all keys are found or the next section starts, so
+        [Desktop Action ...] groups are never read.
+        
+        Returns:
+            Dict with 'name', 'exec' (executable only, no %u/%f args), 'icon'
+            (None when missing) and 'no_display'
+        """
+        entry = {'name': None, 'exec': None, 'icon': None, 'no_display': False}
+        need = {'Name', 'Exec', 'Icon', 'NoDisplay'}
+        sections_seen = 0
+        
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith('['):
+                    sections_seen += 1
+                    if sections_seen == 2:
+                        break
+                    continue
+                
+                key, sep, value = line.partition('=')
+                if not sep or key not in need:
+                    continue
+                need.discard(key)
+                
+                if key == 'Name':
+                    entry['name'] = value
+                elif key == 'Exec':
+                    # Extract executable path (remove %u, %f etc.)
+                    exec_parts = value.split()
+                    if exec_parts:
+                        entry['exec'] = exec_parts[0]
+                elif key == 'Icon':
+                    entry['icon'] = value
+                else:
+                    entry['no_display'] = value == 'true'
+                
+                if not need:
+                    break
+        return entry
     
-    def find_desktop_icon(self, app_path: str) -> Optional[str]:
-        """Find icon path from .desktop file on Linux"""
-        try:
-            # Common desktop file locations
-            desktop_dirs = [
-                '/usr/share/applications',
-                '/usr/local/share/applications',
-                os.path.expanduser('~/.local/share/applications')
-            ]
+    def _build_desktop_index(self) -> Dict[str, Tuple[str, str]]:
+        """Map executables to their .desktop file and icon name (one pass over all files)"""
+        index = {}
+        for desktop_dir in DESKTOP_DIRS:
+            if not os.path.isdir(desktop_dir):
+                continue
             
-            app_name = os.path.basename(app_path)
+            with os.scandir(desktop_dir) as it:
+                desktop_paths = [entry.path for entry in it if entry.name.endswith('.desktop')]
             
-            for desktop_dir in desktop_dirs:
-                if not os.path.exists(desktop_dir):
-                    continue
-                
-                for desktop_file in os.listdir(desktop_dir):
-                    if not desktop_file.endswith('.desktop'):
-                        continue
+            for desktop_path in desktop_paths:
+                try:
+                    entry = self._parse_desktop_entry(desktop_path)
+                    exec_path = entry['exec']
+                    icon_name = entry['icon']
                     
-                    desktop_path = os.path.join(desktop_dir, desktop_file)
-                    try:
-                        with open(desktop_path, 'r') as f:
-                            content = f.read()
-                            if app_name in content or app_path in content:
-                                # Extract Icon= line
-                                for line in content.split('\n'):
-                                    if line.startswith('Icon='):
-                                        icon_name = line.split('=', 1)[1].strip()
-                                        # Try to find the actual icon file
-                                        icon_path = self.find_icon_path(icon_name)
-                                        if icon_path:
-                                            return icon_path
-                    except:
-                        continue
+                    if exec_path and icon_name:
+                        # Earlier directories win, like the old first-match scan
+                        index.setdefault(exec_path, (desktop_path, icon_name))
+                        index.setdefault(os.path.basename(exec_path), (desktop_path, icon_name))
+                except OSError:
+                    continue  # Unreadable or vanished .desktop file
+        return index
+    
+    @staticmethod
+    def _desktop_dirs_mtimes() -> Tuple[Optional[int], ...]:
+        """mtime_ns of each desktop directory (None if missing); changes when entries are added or removed"""
+        mtimes = []
+        for desktop_dir in DESKTOP_DIRS:
+            try:
+                mtimes.append(os.stat(desktop_dir).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+    
+    def refresh_desktop_index(self):
+        """Drop the .desktop index, icon directory listings and no-icon results so icons are looked up again"""
+        with self._icon_lookup_lock:
+            self._desktop_index = None
+            self._desktop_index_generation += 1  # Discard any index still being built
+            self._icon_dir_cache.clear()
+            self._find_icon_by_name_cache.clear()
+            self._find_icon_path_cache.clear()
+        self._icon_negative.clear()
+    
+    def _refresh_desktop_index_if_changed(self):
+        """
+        Refresh the desktop index if a desktop directory changed (entries added
+        or removed) since the last check. Called on the Tk thread once per grid
+        update, so icon workers never stat the directories themselves.
+        """
+        mtimes = self._desktop_dirs_mtimes()
+        if mtimes != self._desktop_index_mtimes:
+            self._desktop_index_mtimes = mtimes
+            self.refresh_desktop_index()
+    
+    def _get_desktop_index(self) -> Dict[str, Tuple[str, str]]:
+        """Current .desktop index, built once on first use (safe to call from icon workers)"""
+        with self._icon_lookup_lock:
+            index = self._desktop_index
+        if index is not None:
+            return index
+        
+        with self._desktop_index_build_lock:
+            with self._icon_lookup_lock:
+                index = self._desktop_index
+                generation = self._desktop_index_generation
+            if index is not None:
+                return index  # Built by another worker while we waited
+            
+            index = self._build_desktop_index()
+            with self._icon_lookup_lock:
+                # A refresh during the build means the result may already be stale
+                if generation == self._desktop_index_generation:
+                    self._desktop_index = index
+        return index
+    
+    def find_desktop_icon(self, app_path: str, size: int = 32) -> Optional[str]:
+        """Find icon path from .desktop file on Linux, preferring the given pixel size"""
+        try:
+            desktop_index = self._get_desktop_index()
+            entry = (desktop_index.get(app_path) or
+                     desktop_index.get(os.path.basename(app_path)))
+            if entry:
+                # Try to find the actual icon file
+                return self.find_icon_path(entry[1], size)
         except Exception as e:
             print(f"Error finding desktop icon: {e}")
         return None
     
-    def find_icon_path(self, icon_name: str) -> Optional[str]:
-        """Find full path for an icon name"""
-        # Common icon directories
-        icon_dirs = [
-            '/usr/share/icons/hicolor/48x48/apps',
-            '/usr/share/icons/hicolor/32x32/apps',
-            '/usr/share/pixmaps',
-            '/usr/share/icons'
-        ]
-        
+    def find_icon_path(self, icon_name: str, size: int = 32) -> Optional[str]:
+        """Find full path for an icon name, preferring the given pixel size"""
+        cache_key = (icon_name, size)
+        with self._icon_lookup_lock:
+            if cache_key in self._find_icon_path_cache:
+                return self._find_icon_path_cache[cache_key]
+        found = self._search_icon_path(icon_name, size)
+        with self._icon_lookup_lock:
+            self._find_icon_path_cache[cache_key] = found
+        return found
+    
+    def _search_icon_path(self, icon_name: str, size: int) -> Optional[str]:
+        """Uncached lookup behind find_icon_path"""
         # If already a full path
         if os.path.exists(icon_name):
             return icon_name
         
         # Search in icon directories
-        for icon_dir in icon_dirs:
-            if not os.path.exists(icon_dir):
-                continue
-            
+        for icon_dir in _icon_path_dirs(size):
             # Try various extensions
-            for ext in ['.png', '.svg', '.xpm', '']:
-                icon_path = os.path.join(icon_dir, icon_name + ext)
-                if os.path.exists(icon_path):
+            for ext in _ICON_PATH_EXTENSIONS:
+                icon_path = self._find_in_icon_dir(icon_dir, icon_name + ext)
+                if icon_path:
                     return icon_path
         
         return None
@@ -328,13 +844,13 @@ class ApplicationManager:
             bg='#1e1e1e',
             highlightthickness=0
         )
-        scrollbar = ttk.Scrollbar(
+        self.apps_scrollbar = scrollbar = ttk.Scrollbar(
             canvas_frame,
             orient=tk.VERTICAL,
             command=self.apps_canvas.yview
         )
         
-        self.apps_canvas.configure(yscrollcommand=scrollbar.set)
+        self.apps_canvas.configure(yscrollcommand=self._on_canvas_yscroll)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.apps_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -346,6 +862,12 @@ class ApplicationManager:
             anchor='nw'
         )
 
+        # Card clicks are bound once on a shared bind tag and resolved to the
+        # card in the handler, rather than bound per widget per card
+        self.apps_container.bind_class(self.CARD_BINDTAG, '<Button-1>', self._on_card_click)
+        self.apps_container.bind_class(self.CARD_BINDTAG, '<Double-Button-1>', self._on_card_double_click)
+        self.apps_container.bind_class(self.CARD_BINDTAG, '<Button-3>', self._on_card_right_click)
+
         # Bind canvas resize
         self.apps_container.bind('<Configure>', self._on_frame_configure)
         self.apps_canvas.bind('<Configure>', self._on_canvas_configure)
@@ -413,66 +935,73 @@ class ApplicationManager:
         else:
             print("Add application callback not set")
     
+    def _read_desktop_entry(self, filepath: str):
+        """Parse one .desktop file for the scanner; returns (filepath, entry or None)"""
+        try:
+            return filepath, self._parse_desktop_entry(filepath)
+        except Exception as e:
+            print(f"Error reading {filepath}: {e}")
+            return filepath, None
+    
+    @staticmethod
+    def _find_executables(top_dir: str) -> List[str]:
+        """Recursively collect .exe paths below a directory"""
+        found = []
+        pending = [top_dir]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    for entry in it:
+                        # Names are checked before any type lookup; on Windows the
+                        # type comes with the directory listing, so no stat() either way
+                        if entry.name.endswith('.exe'):
+                            if entry.is_file():
+                                found.append(entry.path)
+                        elif entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+            except OSError:
+                continue  # Unreadable directory, skipped like os.walk does
+        return found
+    
     def scan_installed_applications(self):
         """Scan system for installed applications (cross-platform)"""
         apps = []
+        # Names/paths already in the config, for O(1) "already added" checks
+        configured = self.app_locker.config["applications"]
+        existing_names = {app['name'] for app in configured}
+        existing_paths = {app['path'] for app in configured}
         
+        # File reads and directory walks are I/O bound and release the GIL,
+        # so they are spread over a thread pool
         if self.is_linux:
             # Scan .desktop files
-            desktop_dirs = [
-                '/usr/share/applications',
-                '/usr/local/share/applications',
-                os.path.expanduser('~/.local/share/applications')
-            ]
+            desktop_paths = []
+            for desktop_dir in DESKTOP_DIRS:
+                if not os.path.isdir(desktop_dir):
+                    continue
+                
+                with os.scandir(desktop_dir) as it:
+                    desktop_paths.extend(entry.path for entry in it if entry.name.endswith('.desktop'))
+            
+            with ThreadPoolExecutor(max_workers=min(32, len(desktop_paths) or 1)) as executor:
+                entries = list(executor.map(self._read_desktop_entry, desktop_paths))
             
-            for desktop_dir in desktop_dirs:
-                if not os.path.exists(desktop_dir):
+            for filepath, entry in entries:
+                if entry is None:
                     continue
+                name = entry['name']
+                exec_path = entry['exec']
                 
-                for filename in os.listdir(desktop_dir):
-                    if not filename.endswith('.desktop'):
-                        continue
-                    
-                    filepath = os.path.join(desktop_dir, filename)
-                    try:
-                        with open(filepath, 'r') as f:
-                            name = None
-                            exec_path = None
-                            icon = None
-                            no_display = False
-                            
-                            for line in f:
-                                line = line.strip()
-                                if line.startswith('Name='):
-                                    name = line.split('=', 1)[1]
-                                elif line.startswith('Exec='):
-                                    exec_line = line.split('=', 1)[1]
-                                    # Extract executable path (remove %u, %f etc.)
-                                    exec_parts = exec_line.split()
-                                    if exec_parts:
-                                        exec_path = exec_parts[0]
-                                elif line.startswith('Icon='):
-                                    icon = line.split('=', 1)[1]
-                                elif line.startswith('NoDisplay=true'):
-                                    no_display = True
-                            
-                            # Only add if has name, exec, not hidden, and not already in config
-                            if name and exec_path and not no_display:
-                                # Check if already added
-                                already_added = any(
-                                    app['name'] == name or app['path'] == exec_path
-                                    for app in self.app_locker.config["applications"]
-                                )
-                                
-                                if not already_added:
-                                    apps.append({
-                                        'name': name,
-                                        'path': exec_path,
-                                        'icon': icon,
-                                        'desktop_file': filepath
-                                    })
-                    except Exception as e:
-                        print(f"Error reading {filepath}: {e}")
+                # Only add if has name, exec, not hidden, and not already in config
+                if name and exec_path and not entry['no_display']:
+                    # Check if already added
+                    if name not in existing_names and exec_path not in existing_paths:
+                        apps.append({
+                            'name': name,
+                            'path': exec_path,
+                            'icon': entry['icon'],
+                            'desktop_file': filepath
+                        })
         else:
             # Windows: Scan common program directories
             program_dirs = [
@@ -481,28 +1010,34 @@ class ApplicationManager:
                 os.path.expanduser(r"~\AppData\Local\Programs")
             ]
             
+            # Each installed program's folder is walked on its own worker
+            exe_paths = []
+            walk_dirs = []
             for prog_dir in program_dirs:
                 if not os.path.exists(prog_dir):
                     continue
                 
-                for root, dirs, files in os.walk(prog_dir):
-                    for file in files:
-                        if file.endswith('.exe'):
-                            filepath = os.path.join(root, file)
-                            name = os.path.splitext(file)[0]
-                            
-                            # Check if already added
-                            already_added = any(
-                                app['path'] == filepath
-                                for app in self.app_locker.config["applications"]
-                            )
-                            
-                            if not already_added:
-                                apps.append({
-                                    'name': name,
-                                    'path': filepath,
-                                    'icon': filepath  # Windows can extract icon from exe
-                                })
+                with os.scandir(prog_dir) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            walk_dirs.append(entry.path)
+                        elif entry.name.endswith('.exe'):
+                            exe_paths.append(entry.path)
+            
+            with ThreadPoolExecutor(max_workers=min(16, len(walk_dirs) or 1)) as executor:
+                for found in executor.map(self._find_executables, walk_dirs):
+                    exe_paths.extend(found)
+            
+            for filepath in exe_paths:
+                name = os.path.splitext(os.path.basename(filepath))[0]
+                
+                # Check if already added
+                if filepath not in existing_paths:
+                    apps.append({
+                        'name': name,
+                        'path': filepath,
+                        'icon': filepath  # Windows can extract icon from exe
+                    })
         
         # Sort by name
         apps.sort(key=lambda x: x['name'].lower())
@@ -544,6 +1079,8 @@ class ApplicationManager:
         loading_dialog.update()
         
         # Scan for applications (this may take a few seconds)
+        # Newly installed apps may have added .desktop files since the last scan
+        self.refresh_desktop_index()
         try:
             scanned_apps = self.scan_installed_applications()
             loading_dialog.destroy()
@@ -620,7 +1157,7 @@ class ApplicationManager:
                 bg='#2a2a2a',
                 relief=tk.RAISED,
                 borderwidth=1,
-                highlightthickness=2,
+                highlightthickness=3,  # Fixed; selection only changes the colour
                 highlightbackground='#444444'
             )
             card.grid(row=row, column=col, padx=5, pady=5, sticky='nsew')
@@ -630,22 +1167,10 @@ class ApplicationManager:
             inner = tk.Frame(card, bg='#2a2a2a')
             inner.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
             
-            # Icon (smaller)
-            icon_photo = self.get_app_icon(app['path'])
-            if icon_photo:
-                try:
-                    icon_path = self.find_desktop_icon(app['path'])
-                    if icon_path and os.path.exists(icon_path):
-                        img = Image.open(icon_path)
-                        img = img.resize((32, 32), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        icon_label = tk.Label(inner, image=photo, bg='#2a2a2a')
-                        icon_label.image = photo
-                        icon_label.pack()
-                except:
-                    tk.Label(inner, text="📦", font=("TkDefaultFont", 16), bg='#2a2a2a').pack()
-            else:
-                tk.Label(inner, text="📦", font=("TkDefaultFont", 16), bg='#2a2a2a').pack()
+            # Icon (smaller) - placeholder until it is decoded off-thread
+            icon_label = tk.Label(inner, text="📦", font=("TkDefaultFont", 16), bg='#2a2a2a')
+            icon_label.pack()
+            self.load_app_icon_async(app['path'], (32, 32), self._show_icon_on(icon_label))
             
             # Name
             name_label = tk.Label(
@@ -667,7 +1192,7 @@ class ApplicationManager:
                         if card_widget.app_data in selected_scan_apps:
                             selected_scan_apps.remove(card_widget.app_data)
                     else:
-                        card_widget.configure(highlightbackground='#009E60', highlightthickness=3)
+                        card_widget.configure(highlightbackground='#009E60')
                         card_widget.is_selected = True
                         if card_widget.app_data not in selected_scan_apps:
                             selected_scan_apps.append(card_widget.app_data)
@@ -705,7 +1230,7 @@ class ApplicationManager:
         def select_all():
             for widget in scan_container.winfo_children():
                 if hasattr(widget, 'app_data') and not widget.is_selected:
-                    widget.configure(highlightbackground='#009E60', highlightthickness=3)
+                    widget.configure(highlightbackground='#009E60')
                     widget.is_selected = True
                     if widget.app_data not in selected_scan_apps:
                         selected_scan_apps.append(widget.app_data)
@@ -714,7 +1239,7 @@ class ApplicationManager:
         def deselect_all():
             for widget in scan_container.winfo_children():
                 if hasattr(widget, 'app_data') and widget.is_selected:
-                    widget.configure(highlightbackground='#444444', highlightthickness=2)
+                    widget.configure(highlightbackground='#444444')
                     widget.is_selected = False
             selected_scan_apps.clear()
             status_label.config(text="Selected: 0 apps")
@@ -739,30 +1264,49 @@ class ApplicationManager:
     
     def _on_frame_configure(self, event=None):
         """Reset the scroll region to encompass the inner frame"""
+        self._schedule_configure()
+    
+    def _on_canvas_configure(self, event):
+        """When canvas is resized, adjust the container width to match canvas"""
+        self._pending_canvas_width = event.width
+        self._canvas_height = event.height
+        self._schedule_configure()
+    
+    def _schedule_configure(self):
+        """Run _do_configure once the current burst of Configure events is over"""
+        if self._configure_pending:
+            return
+        self._configure_pending = True
+        self.master.after_idle(self._do_configure)
+    
+    def _do_configure(self):
+        """Apply pending canvas/container size changes in a single pass"""
+        self._configure_pending = False  # Changes made below may schedule another pass
+        
+        if self._pending_canvas_width is not None:
+            # Only set width, the height follows the number of card rows
+            self.apps_canvas.itemconfig(self.canvas_window, width=self._pending_canvas_width)
+            self._pending_canvas_width = None
+        
         # Update scroll region
         self.apps_canvas.configure(scrollregion=self.apps_canvas.bbox("all"))
         
-        # Check if scrolling is needed
-        canvas_height = self.apps_canvas.winfo_height()
-        content_height = self.apps_container.winfo_reqheight()
-        
         # If content fits, reset scroll to top
-        if content_height <= canvas_height:
+        if self._content_height <= self._canvas_height:
             self.apps_canvas.yview_moveto(0)
+        
+        # A taller canvas may expose more rows
+        self._render_viewport()
     
-    def _on_canvas_configure(self, event):
-        """When canvas is resized, adjust the container width to match canvas"""
-        canvas_width = event.width
-        # Only set width, let height be determined by content
-        self.apps_canvas.itemconfig(self.canvas_window, width=canvas_width)
+    def _on_canvas_yscroll(self, first, last):
+        """Keep the scrollbar in sync and render the rows that scrolled into view"""
+        self.apps_scrollbar.set(first, last)
+        self._render_viewport()
     
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling - only if content exceeds canvas"""
-        canvas_height = self.apps_canvas.winfo_height()
-        content_height = self.apps_container.winfo_reqheight()
-        
-        # Only scroll if content is larger than canvas
-        if content_height > canvas_height:
+        # Both heights are cached (on refresh / Configure), no Tk round-trip per tick
+        if self._content_height > self._canvas_height:
             if event.num == 4 or event.delta > 0:
                 self.apps_canvas.yview_scroll(-1, "units")
             elif event.num == 5 or event.delta < 0:
@@ -778,7 +1322,17 @@ class ApplicationManager:
         if not self.selected_apps:
             return
         
-        # Create context menu
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
+        
+        # Display menu at cursor position
+        try:
+            self._context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self._context_menu.grab_release()
+    
+    def _build_context_menu(self) -> tk.Menu:
+        """Create the card context menu; it acts on self.selected_apps, so one menu serves every card"""
         context_menu = tk.Menu(self.master, tearoff=0)
         context_menu.add_command(label="✏️ Edit", command=self.edit_application)
         context_menu.add_command(label="🗑️ Remove", command=self.remove_applications)
@@ -787,191 +1341,248 @@ class ApplicationManager:
         context_menu.add_command(label="📋 Copy Path", command=self.copy_path)
         context_menu.add_separator()
         context_menu.add_command(label="📂 Open File Location", command=self.open_file_location)
-        
-        # Display menu at cursor position
-        try:
-            context_menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            context_menu.grab_release()
+        return context_menu
     
     def update_apps_listbox(self):
         """Update the applications grid with current apps"""
-        print("\n=== UPDATE_APPS_GRID START ===")
+        logger.debug("=== UPDATE_APPS_GRID START ===")
         
-        # Clear existing cards
-        for widget in self.apps_container.winfo_children():
-            widget.destroy()
+        # Pick up .desktop files added or removed since the last update, once
+        # per refresh here rather than on every icon lookup in the workers
+        if self.is_linux:
+            self._refresh_desktop_index_if_changed()
         
-        self.selected_apps = []
-        app_count = len(self.app_locker.config["applications"])
-        print(f"Total applications: {app_count}")
+        # Recycle the cards in view; they are rebound to the new list below
+        for card in self._visible_cards.values():
+            card.place_forget()
+            self._card_pool.append(card)
+        self._visible_cards.clear()
+        
+        self.selected_apps = {}
+        applications = self.app_locker.config["applications"]
+        app_count = len(applications)
+        self._app_index_by_name = {app['name']: idx for idx, app in enumerate(applications)}
+        self._ensure_metadata(applications)
+        logger.debug("Total applications: %d", app_count)
         
         if app_count == 0:
             # Show empty state
-            empty_label = ttk.Label(
-                self.apps_container,
-                text="No applications added yet.\nClick '➕ Add' to get started!",
-                font=("TkDefaultFont", 12),
-                foreground='#888888',
-                justify='center'
-            )
-            empty_label.pack(expand=True, pady=50)
-        else:
-            # Create grid of application cards
-            columns = 3  # Number of cards per row
-            
-            for index, app in enumerate(self.app_locker.config["applications"]):
-                print(f"\n  App {index + 1}: {app['name']}")
-                print(f"    Path: {app['path']}")
-                
-                # Get metadata
-                meta = self.get_app_metadata(app['name'])
-                unlock_count = meta.get('unlock_count', 0)
-                print(f"    Unlock count: {unlock_count}")
-                
-                # Calculate grid position
-                row = index // columns
-                col = index % columns
-                
-                # Create application card
-                card = self.create_app_card(app, meta, index)
-                card.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
-            
-            # Configure grid weights for responsiveness
-            for col in range(columns):
-                self.apps_container.grid_columnconfigure(col, weight=1, minsize=200)
+            if self._empty_label is None:
+                self._empty_label = ttk.Label(
+                    self.apps_container,
+                    text="No applications added yet.\nClick '➕ Add' to get started!",
+                    font=("TkDefaultFont", 12),
+                    foreground='#888888',
+                    justify='center'
+                )
+            self._empty_label.place(relx=0.5, y=50, anchor='n')
+        elif self._empty_label is not None:
+            self._empty_label.place_forget()
+        
+        # Size the container for every row so the scrollbar is right, but only
+        # create widgets for the rows in view (see _render_viewport)
+        rows = -(-app_count // self.CARD_COLUMNS)
+        self._content_height = rows * self.CARD_ROW_HEIGHT
+        self.apps_canvas.itemconfig(
+            self.canvas_window,
+            height=max(self._content_height, self.CARD_ROW_HEIGHT)
+        )
+        self._render_viewport()
         
         # Update app count label
         self.app_count_label.config(text=f"Applications: {app_count}")
-        print(f"\n=== UPDATE_APPS_GRID END (Total: {app_count}) ===\n")
+        logger.debug("=== UPDATE_APPS_GRID END (Total: %d) ===", app_count)
+        # Let the cards paint first; back-to-back refreshes share one update
+        if not self._config_update_pending:
+            self._config_update_pending = True
+            self.master.after_idle(self._run_config_update)
+    
+    def _run_config_update(self):
+        """Idle callback for the config display update queued by update_apps_listbox"""
+        self._config_update_pending = False
         self.update_config_display()
     
-    def create_app_card(self, app, meta, index):
-        """Create a single application card with icon, name, and stats"""
+    def _render_viewport(self):
+        """Place cards for the rows currently in view, recycling the ones that scrolled out"""
+        applications = self.app_locker.config["applications"]
+        columns = self.CARD_COLUMNS
+        row_height = self.CARD_ROW_HEIGHT
+        pad = self.CARD_PADDING
+        
+        top = self.apps_canvas.canvasy(0)
+        bottom = top + self.apps_canvas.winfo_height()
+        start = max(0, int(top // row_height)) * columns
+        end = min(len(applications), (int(bottom // row_height) + 1) * columns)
+        
+        for index in [i for i in self._visible_cards if not start <= i < end]:
+            card = self._visible_cards.pop(index)
+            card.place_forget()
+            self._card_pool.append(card)
+        
+        for index in range(start, end):
+            if index in self._visible_cards:
+                continue
+            card = self._card_pool.pop() if self._card_pool else self.create_app_card()
+            self._bind_card(card, applications[index], index)
+            self._visible_cards[index] = card
+            
+            row, col = divmod(index, columns)
+            card.place(
+                relx=col / columns, relwidth=1 / columns,
+                x=pad, width=-2 * pad,
+                y=row * row_height + pad, height=row_height - 2 * pad
+            )
+    
+    def create_app_card(self):
+        """Create an empty application card; _bind_card fills in the app it shows"""
         # Main card frame with border
         card_frame = tk.Frame(
             self.apps_container,
             bg='#2a2a2a',
             relief=tk.RAISED,
             borderwidth=1,
-            highlightthickness=2,
+            highlightthickness=3,  # Fixed; selection only changes the colour
             highlightbackground='#444444'
         )
         
-        # Store app data
-        card_frame.app_name = app['name']
-        card_frame.app_path = app['path']
-        card_frame.app_index = index
+        # App data, set by _bind_card
+        card_frame.app_name = None
+        card_frame.app_path = None
+        card_frame.app_index = None
         card_frame.is_selected = False
         
-        # Inner padding frame
-        inner_frame = tk.Frame(card_frame, bg='#2a2a2a')
-        inner_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Icon section
-        icon_frame = tk.Frame(inner_frame, bg='#2a2a2a')
-        icon_frame.pack(pady=(0, 10))
+        # The card's size is fixed by _render_viewport, and its labels sit at
+        # fixed offsets, so changing a label's text never re-runs the layout
         
-        # Try to get actual icon (returns PhotoImage or None)
-        photo = self.get_app_icon(app['path'])
-        if photo:
-            print(f"    ✓ Icon found and loaded")
-            try:
-                # Resize the cached PhotoImage
-                # Note: get_app_icon returns 48x48, we want 64x64
-                # So we need to get the path and reload
-                icon_path = self.find_desktop_icon(app['path'])
-                if icon_path and os.path.exists(icon_path):
-                    img = Image.open(icon_path)
-                    img = img.resize((64, 64), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                    
-                    icon_label = tk.Label(icon_frame, image=photo, bg='#2a2a2a')
-                    icon_label.image = photo  # Keep reference
-                    icon_label.pack()
-                else:
-                    raise Exception("Could not find icon file")
-            except Exception as e:
-                print(f"    ✗ Error resizing icon: {e}")
-                # Fallback to emoji
-                icon_label = tk.Label(
-                    icon_frame,
-                    text="📦",
-                    font=("TkDefaultFont", 32),
-                    bg='#2a2a2a'
-                )
-                icon_label.pack()
-        else:
-            print(f"    ✗ No icon found, using emoji fallback")
-            icon_label = tk.Label(
-                icon_frame,
-                text="📦",
-                font=("TkDefaultFont", 32),
-                bg='#2a2a2a'
-            )
-            icon_label.pack()
+        # Placeholder until the icon is decoded off-thread
+        icon_label = tk.Label(
+            card_frame,
+            image=self._get_fallback_icon(),
+            bg='#2a2a2a'
+        )
+        icon_label.place(relx=0.5, y=10, width=64, height=64, anchor='n')
         
         # App name
         name_label = tk.Label(
-            inner_frame,
-            text=app['name'],
+            card_frame,
             font=("TkDefaultFont", 11, "bold"),
             bg='#2a2a2a',
-            fg='#ffffff',
-            wraplength=180
+            fg='#ffffff'
         )
-        name_label.pack(pady=(0, 5))
+        name_label.place(relx=0.5, y=90, relwidth=1, width=-20, anchor='n')
         
         # Stats
-        unlock_count = meta.get('unlock_count', 0)
         stats_label = tk.Label(
-            inner_frame,
-            text=f"🔓 {unlock_count}× unlocked",
+            card_frame,
             font=("TkDefaultFont", 9),
             bg='#2a2a2a',
             fg='#888888'
         )
-        stats_label.pack()
+        stats_label.place(relx=0.5, y=120, anchor='n')
         
-        # Bind events for interaction
-        def on_click(event):
-            self.toggle_card_selection(card_frame)
+        card_frame.icon_label = icon_label
+        card_frame.name_label = name_label
+        card_frame.stats_label = stats_label
         
-        def on_double_click(event):
-            self.edit_application_from_card(card_frame)
+        # Route clicks on any part of the card to the shared card handlers
+        for widget in [card_frame, icon_label, name_label, stats_label]:
+            widget.bindtags((self.CARD_BINDTAG,) + widget.bindtags())
         
-        def on_right_click(event):
-            self.show_card_context_menu(event, card_frame)
+        return card_frame
+    
+    def _bind_card(self, card, app, index):
+        """Point a pooled card at an application, reusing its widgets"""
+        logger.debug("App %d: %s (%s)", index + 1, app['name'], app['path'])
+        
+        # Read-only: the entry was created by update_apps_listbox, and the live
+        # count is kept in the flat counter dict
+        unlock_count = self._unlock_counts.get(app['name'], 0)
+        logger.debug("Unlock count for %s: %d", app['name'], unlock_count)
+        
+        card.app_name = app['name']
+        card.app_path = app['path']
+        card.app_index = index
+        card.is_selected = app['name'] in self.selected_apps
+        if card.is_selected:
+            card.configure(highlightbackground='#009E60')
+        else:
+            card.configure(highlightbackground='#444444')
         
-        # Bind to all widgets in card
-        for widget in [card_frame, inner_frame, icon_frame, icon_label, name_label, stats_label]:
-            widget.bind('<Button-1>', on_click)
-            widget.bind('<Double-Button-1>', on_double_click)
-            widget.bind('<Button-3>', on_right_click)
+        name = app['name']
+        if len(name) > self.CARD_NAME_MAX_CHARS:
+            name = name[:self.CARD_NAME_MAX_CHARS - 1] + '…'
+        card.name_label.configure(text=name)
+        card.stats_label.configure(text=f"🔓 {unlock_count}× unlocked")
         
-        return card_frame
+        # Back to the placeholder until this app's icon is ready
+        fallback_icon = self._get_fallback_icon()
+        card.icon_label.configure(image=fallback_icon)
+        card.icon_label.image = fallback_icon
+        show_icon = self._show_icon_on(card.icon_label)
+        
+        def on_ready(photo, app_path=app['path']):
+            if card.app_path == app_path:  # Card may have been recycled meanwhile
+                show_icon(photo)
+        
+        self.load_app_icon_async(app['path'], (64, 64), on_ready)
+    
+    @staticmethod
+    def _card_from_event(event) -> Optional[tk.Frame]:
+        """Walk up from the clicked widget to the card frame that owns it"""
+        widget = event.widget
+        while widget is not None and not hasattr(widget, 'app_name'):
+            widget = widget.master
+        return widget
+    
+    def _find_app_index(self, app_name: str) -> Optional[int]:
+        """Index of an application in config["applications"] by name, or None"""
+        applications = self.app_locker.config["applications"]
+        idx = self._app_index_by_name.get(app_name)
+        if idx is None or idx >= len(applications) or applications[idx]["name"] != app_name:
+            # Config changed since the last refresh; reindex
+            self._app_index_by_name = {app['name']: i for i, app in enumerate(applications)}
+            idx = self._app_index_by_name.get(app_name)
+        return idx
+    
+    def _find_app_path(self, app_name: str) -> Optional[str]:
+        """Path of an application by name, or None"""
+        idx = self._find_app_index(app_name)
+        return None if idx is None else self.app_locker.config["applications"][idx]["path"]
+    
+    def _on_card_click(self, event):
+        card = self._card_from_event(event)
+        if card is not None:
+            self.toggle_card_selection(card)
+    
+    def _on_card_double_click(self, event):
+        card = self._card_from_event(event)
+        if card is not None:
+            self.edit_application_from_card(card)
+    
+    def _on_card_right_click(self, event):
+        card = self._card_from_event(event)
+        if card is not None:
+            self.show_card_context_menu(event, card)
     
     def toggle_card_selection(self, card):
         """Toggle selection state of a card"""
         if card.is_selected:
             # Deselect
-            card.configure(highlightbackground='#444444', highlightthickness=2)
+            card.configure(highlightbackground='#444444')
             card.is_selected = False
-            if card.app_name in self.selected_apps:
-                self.selected_apps.remove(card.app_name)
+            self.selected_apps.pop(card.app_name, None)
         else:
             # Select
-            card.configure(highlightbackground='#009E60', highlightthickness=3)
+            card.configure(highlightbackground='#009E60')
             card.is_selected = True
-            if card.app_name not in self.selected_apps:
-                self.selected_apps.append(card.app_name)
+            self.selected_apps[card.app_name] = None
         
-        print(f"Selected apps: {self.selected_apps}")
+        logger.debug("Selected apps: %s", list(self.selected_apps))
     
     def edit_application_from_card(self, card):
         """Edit application from card"""
         # Ensure only this card is selected
-        self.selected_apps = [card.app_name]
+        self.selected_apps = {card.app_name: None}
         self.edit_application()
     
     def show_card_context_menu(self, event, card):
@@ -989,7 +1600,7 @@ class ApplicationManager:
             self.show_message("Error", "Please select at least one application to remove.")
             return
         
-        app_names = self.selected_apps.copy()
+        app_names = list(self.selected_apps)
         count = len(app_names)
         
         # Show confirmation dialog
@@ -1005,11 +1616,21 @@ class ApplicationManager:
             return
         
         # Remove all selected applications
+        if count == 1:
+            self.app_locker.remove_application(app_names[0])
+        else:
+            # One pass over the list and one (encrypted) config save, instead
+            # of remove_application's filter-and-save per app
+            to_remove = set(app_names)
+            self.app_locker.config["applications"] = [
+                app for app in self.app_locker.config["applications"] if app["name"] not in to_remove
+            ]
+            self.app_locker.save_config()
+        
+        # Remove metadata
         for app_name in app_names:
-            self.app_locker.remove_application(app_name)
-            # Remove metadata
-            if app_name in self.metadata:
-                del self.metadata[app_name]
+            self.metadata.pop(app_name, None)
+            self._move_counters(app_name)
         
         self.save_metadata()
         self.update_apps_listbox()
@@ -1030,22 +1651,17 @@ class ApplicationManager:
             return
         
         # Get the selected app name
-        old_name = self.selected_apps[0]
+        old_name = next(iter(self.selected_apps))
         
         # Find the app in config
-        app_index = None
-        old_path = None
-        for idx, app in enumerate(self.app_locker.config["applications"]):
-            if app["name"] == old_name:
-                app_index = idx
-                old_path = app["path"]
-                break
+        app_index = self._find_app_index(old_name)
         
         if app_index is None:
             self.show_message("Error", "Application not found in configuration.")
             return
         
         # Create edit dialog
+        old_path = self.app_locker.config["applications"][app_index]["path"]
         self.edit_application_dialog(old_name, old_path, app_index)
     
     def edit_application_dialog(self, old_name, old_path, app_index):
@@ -1143,10 +1759,10 @@ class ApplicationManager:
                 return
             
             # Check if name already exists (excluding current app)
-            for idx, app in enumerate(self.app_locker.config["applications"]):
-                if idx != app_index and app["name"] == new_name:
-                    self.show_message("Error", f"An application with name '{new_name}' already exists.")
-                    return
+            existing_index = self._find_app_index(new_name)
+            if existing_index is not None and existing_index != app_index:
+                self.show_message("Error", f"An application with name '{new_name}' already exists.")
+                return
             
             # Update the application
             self.app_locker.config["applications"][app_index]["name"] = new_name
@@ -1155,7 +1771,9 @@ class ApplicationManager:
             # Update metadata
             if old_name != new_name and old_name in self.metadata:
                 # Rename metadata entry
+                self._fold_counters()
                 self.metadata[new_name] = self.metadata.pop(old_name)
+                self._move_counters(old_name, new_name)
             
             self.update_modified_timestamp(new_name)
             
@@ -1190,7 +1808,7 @@ class ApplicationManager:
             self.show_message("Error", "Please select an application to view statistics.")
             return
         
-        app_name = self.selected_apps[0]
+        app_name = next(iter(self.selected_apps))
         meta = self.get_app_metadata(app_name)
         
         # Format statistics
@@ -1214,14 +1832,10 @@ class ApplicationManager:
         if not self.selected_apps:
             return
         
-        app_name = self.selected_apps[0]
+        app_name = next(iter(self.selected_apps))
         
         # Find path in config
-        path = None
-        for app in self.app_locker.config["applications"]:
-            if app["name"] == app_name:
-                path = app["path"]
-                break
+        path = self._find_app_path(app_name)
         
         if path:
             self.master.clipboard_clear()
@@ -1233,35 +1847,38 @@ class ApplicationManager:
         if not self.selected_apps:
             return
         
-        app_name = self.selected_apps[0]
+        app_name = next(iter(self.selected_apps))
         
         # Find path in config
-        path = None
-        for app in self.app_locker.config["applications"]:
-            if app["name"] == app_name:
-                path = app["path"]
-                break
+        path = self._find_app_path(app_name)
         
         if path:
             directory = os.path.dirname(path)
             if os.path.exists(directory):
+                # No shell: argv goes straight to exec, so quotes in paths are harmless
                 if self.is_linux:
-                    os.system(f'xdg-open "{directory}" &')
+                    subprocess.Popen(['xdg-open', directory], close_fds=True, start_new_session=True)
                 else:
-                    os.system(f'explorer "{directory}"')
+                    subprocess.Popen(['explorer', directory])
             else:
                 self.show_message("Error", f"Directory does not exist:\n{directory}")
     
     def select_all_apps(self):
         """Select all application cards"""
-        for widget in self.apps_container.winfo_children():
-            if hasattr(widget, 'app_name') and not widget.is_selected:
-                self.toggle_card_selection(widget)
+        # Replace the selection in one go (cards outside the viewport only
+        # exist as names), then restyle just the cards in view
+        self.selected_apps = dict.fromkeys(app['name'] for app in self.app_locker.config["applications"])
+        for card in self._visible_cards.values():
+            if not card.is_selected:
+                card.is_selected = True
+                card.configure(highlightbackground='#009E60')
         return 'break'  # Prevent default Ctrl+A behavior
     
     def deselect_all_apps(self):
         """Deselect all application cards"""
-        for widget in self.apps_container.winfo_children():
-            if hasattr(widget, 'app_name') and widget.is_selected:
-                self.toggle_card_selection(widget)
+        self.selected_apps = {}
+        for card in self._visible_cards.values():
+            if card.is_selected:
+                card.is_selected = False
+                card.configure(highlightbackground='#444444')
 
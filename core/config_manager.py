@@ -8,6 +8,8 @@ import os
 import time
 from tkinter import filedialog, messagebox
 
+from core.json_utils import dumps_json, loads_json
+
 
 class ConfigManager:
     """
@@ -50,8 +52,8 @@ class ConfigManager:
                     "locked_files_and_folders": self.app_locker.config.get("locked_files_and_folders", [])
                 }
                 
-                with open(file_path, "w") as f:
-                    json.dump(export_data, f, indent=4)
+                with open(file_path, "wb") as f:
+                    f.write(dumps_json(export_data, indent=True))
                 
                 app_count = len(export_data.get("applications", []))
                 item_count = len(export_data.get("locked_files_and_folders", []))
@@ -90,8 +92,8 @@ class ConfigManager:
         
         try:
             # Read the imported config
-            with open(file_path, "r") as f:
-                imported_config = json.load(f)
+            with open(file_path, "rb") as f:
+                imported_config = loads_json(f.read())
             
             # Validate the config structure
             if not isinstance(imported_config, dict) or "applications" not in imported_config:
@@ -123,8 +125,8 @@ class ConfigManager:
             os.makedirs(os.path.dirname(backup_path), exist_ok=True)
             
             try:
-                with open(backup_path, 'w') as f:
-                    json.dump(self.app_locker.config, f, indent=4)
+                with open(backup_path, 'wb') as f:
+                    f.write(dumps_json(self.app_locker.config, indent=True))
                 print(f"Backup created at: {backup_path}")
             except Exception as e:
                 print(f"Warning: Could not create backup: {e}")
@@ -3,13 +3,13 @@ Crypto Manager - Encryption and Decryption Operations
 Handles all cryptographic operations for FadCrypt
 """
 
+import hashlib
 import os
 import json
-from typing import Optional, Dict, Any
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
+from typing import Optional, Dict, Any, Tuple
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from core.json_utils import dumps_json, loads_json
 
 
 class CryptoManager:
@@ -24,16 +24,23 @@ class CryptoManager:
         TAG_SIZE: Size of authentication tag in bytes (16 bytes = 128 bits)
         KEY_LENGTH: Length of derived key in bytes (32 bytes = 256 bits)
         ITERATIONS: Number of PBKDF2 iterations (100,000)
+        KEY_CACHE_SIZE: Number of derived keys kept in memory (4)
     """
     
     SALT_SIZE = 16
     TAG_SIZE = 16
     KEY_LENGTH = 32
     ITERATIONS = 100000
+    KEY_CACHE_SIZE = 4
     
     def __init__(self):
         """Initialize the CryptoManager."""
-        pass
+        # Recently derived keys by (password digest, salt), so decrypting the
+        # same file again (e.g. the password file on every verification) skips
+        # PBKDF2. Passwords are only kept as a BLAKE2b digest keyed with a
+        # per-process secret; insertion-ordered for FIFO eviction.
+        self._key_cache: Dict[Tuple[bytes, bytes], bytes] = {}
+        self._key_cache_secret = os.urandom(32)
     
     def derive_key(self, password: bytes, salt: bytes) -> bytes:
         """
@@ -46,20 +53,33 @@ class CryptoManager:
         Returns:
             Derived 256-bit key as bytes
         """
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=self.KEY_LENGTH,
-            salt=salt,
-            iterations=self.ITERATIONS,
-            backend=default_backend()
+        cache_key = (
+            hashlib.blake2b(password, digest_size=16, key=self._key_cache_secret).digest(),
+            salt
         )
-        return kdf.derive(password)
+        key = self._key_cache.get(cache_key)
+        if key is not None:
+            return key
+        
+        # Same PBKDF2-HMAC-SHA256 as cryptography's PBKDF2HMAC, but computed by
+        # OpenSSL in a single call with no KDF object per derivation
+        key = hashlib.pbkdf2_hmac('sha256', password, salt, self.ITERATIONS, dklen=self.KEY_LENGTH)
+        self._key_cache[cache_key] = key
+        if len(self._key_cache) > self.KEY_CACHE_SIZE:
+            del self._key_cache[next(iter(self._key_cache))]
+        return key
+    
+    def clear_keys(self):
+        """Forget all cached derived keys (e.g. after the master password changes)."""
+        self._key_cache.clear()
     
     def encrypt_data(self, password: bytes, data: Dict[str, Any], file_path: str) -> bool:
         """
         Encrypt data and save to file using AES-256-GCM.
         
         File format: [salt:16][tag:16][encrypted_data:variable]
+        The salt doubles as the GCM nonce; the key is derived from it, so it
+        is unique per file.
         
         Args:
             password: Password for encryption (as bytes)
@@ -76,21 +96,14 @@ class CryptoManager:
             # Derive key from password
             key = self.derive_key(password, salt)
             
-            # Create cipher with GCM mode
-            cipher = Cipher(
-                algorithms.AES(key),
-                modes.GCM(salt),
-                backend=default_backend()
-            )
-            encryptor = cipher.encryptor()
-            
-            # Convert data to JSON and encrypt
-            json_data = json.dumps(data).encode('utf-8')
-            encrypted_data = encryptor.update(json_data) + encryptor.finalize()
+            # Convert data to JSON and encrypt (one-shot; returns ciphertext + tag)
+            json_data = dumps_json(data)
+            sealed = AESGCM(key).encrypt(salt, json_data, None)
+            encrypted_data, tag = sealed[:-self.TAG_SIZE], sealed[-self.TAG_SIZE:]
             
             # Write to file: salt + tag + encrypted_data
             with open(file_path, 'wb') as f:
-                f.write(salt + encryptor.tag + encrypted_data)
+                f.write(salt + tag + encrypted_data)
             
             return True
             
@@ -129,17 +142,11 @@ class CryptoManager:
             # Derive key from password
             key = self.derive_key(password, salt)
             
-            # Create cipher and decrypt
-            cipher = Cipher(
-                algorithms.AES(key),
-                modes.GCM(salt, tag),
-                backend=default_backend()
-            )
-            decryptor = cipher.decryptor()
-            decrypted_data = decryptor.update(encrypted_data) + decryptor.finalize()
+            # Decrypt and verify the tag in one call
+            decrypted_data = AESGCM(key).decrypt(salt, encrypted_data + tag, None)
             
             # Parse JSON
-            return json.loads(decrypted_data.decode('utf-8'))
+            return loads_json(decrypted_data)
             
         except FileNotFoundError:
             if not suppress_errors:
@@ -180,20 +187,13 @@ class CryptoManager:
             # Derive key from password
             key = self.derive_key(password, salt)
             
-            # Create cipher with GCM mode
-            cipher = Cipher(
-                algorithms.AES(key),
-                modes.GCM(salt),
-                backend=default_backend()
-            )
-            encryptor = cipher.encryptor()
-            
-            # Encrypt the password hash
-            encrypted_hash = encryptor.update(password_hash) + encryptor.finalize()
+            # Encrypt the password hash (one-shot; returns ciphertext + tag)
+            sealed = AESGCM(key).encrypt(salt, password_hash, None)
+            encrypted_hash, tag = sealed[:-self.TAG_SIZE], sealed[-self.TAG_SIZE:]
             
             # Write to file: salt + tag + encrypted_hash
             with open(file_path, 'wb') as f:
-                f.write(salt + encryptor.tag + encrypted_hash)
+                f.write(salt + tag + encrypted_hash)
             
             return True
             
@@ -230,14 +230,8 @@ class CryptoManager:
             # Derive key from password
             key = self.derive_key(password, salt)
             
-            # Create cipher and decrypt
-            cipher = Cipher(
-                algorithms.AES(key),
-                modes.GCM(salt, tag),
-                backend=default_backend()
-            )
-            decryptor = cipher.decryptor()
-            decrypted_hash = decryptor.update(encrypted_hash) + decryptor.finalize()
+            # Decrypt and verify the tag in one call
+            decrypted_hash = AESGCM(key).decrypt(salt, encrypted_hash + tag, None)
             
             return decrypted_hash
             
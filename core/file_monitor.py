@@ -3,13 +3,23 @@ File Monitor - Config File Backup and Recovery
 Monitors critical configuration files and automatically restores them if deleted
 """
 
+import hashlib
 import os
 import shutil
 import threading
 import time
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
-from typing import List, Callable, Optional
+from typing import Dict, List, Callable, Optional
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """Return the SHA-256 hex digest of a file's contents, or None if unreadable."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
 
 
 class ConfigFileMonitor:
@@ -139,6 +149,10 @@ class ConfigFileMonitor:
             super().__init__()
             self.files_to_monitor = files_to_monitor
             self.backup_folder = backup_folder
+            # Digest of the content last written to each backup. watchdog can
+            # report several modify events per save, so unchanged content is
+            # skipped instead of being copied again.
+            self._backup_digests: Dict[str, str] = {}
         
         def on_modified(self, event):
             """Handle file modification events."""
@@ -162,6 +176,15 @@ class ConfigFileMonitor:
             """
             if os.path.exists(file_path):
                 backup_path = os.path.join(self.backup_folder, os.path.basename(file_path))
+                digest = _file_digest(file_path)
+                if digest is not None:
+                    if backup_path not in self._backup_digests:
+                        # First event for this file - seed from the existing backup
+                        backup_digest = _file_digest(backup_path)
+                        if backup_digest is not None:
+                            self._backup_digests[backup_path] = backup_digest
+                    if self._backup_digests.get(backup_path) == digest:
+                        return
                 try:
                     # Ensure backup folder exists with write permissions
                     os.makedirs(self.backup_folder, mode=0o755, exist_ok=True)
@@ -172,6 +195,8 @@ class ConfigFileMonitor:
                     # Ensure backup file is writable for future overwrites
                     os.chmod(backup_path, 0o644)
                     
+                    if digest is not None:
+                        self._backup_digests[backup_path] = digest
                     print(f"[FILE MONITOR] ✅ Backed up: {os.path.basename(file_path)}")
                 except PermissionError as e:
                     # Silently skip if backup folder is not writable
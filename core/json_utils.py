@@ -0,0 +1,41 @@
+"""
+JSON Utils - Shared JSON serialization helpers
+Compact output and parsing use orjson when it is installed, with the stdlib
+json module as the fallback; indented output always uses the stdlib
+"""
+
+import json
+from typing import Any
+
+# orjson (optional) serializes straight to bytes in C; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    Args:
+        data: Object to serialize
+        indent: Pretty-print for human-readable files (configs, metadata)
+
+    Returns:
+        Encoded JSON, compact unless indent is set
+    """
+    if indent:
+        # Always the stdlib encoder, so files users read or diff have the same
+        # 4-space layout whether or not orjson is installed
+        return json.dumps(data, indent=4).encode('utf-8')
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (raises a json.JSONDecodeError subclass on bad input)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -168,6 +168,9 @@ class PasswordManager:
                     print("[PasswordManager] Warning: Failed to re-encrypt some configs")
                     # Don't revert password change - user can manually re-encrypt
             
+            # Keys derived from the old password are no longer needed
+            self.crypto.clear_keys()
+            
             print("[PasswordManager] Password changed successfully")
             return True
             
@@ -7,6 +7,7 @@ import os
 import sys
 import platform
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class SingleInstanceBase(ABC):
@@ -107,16 +108,25 @@ class SingleInstanceLinux(SingleInstanceBase):
     """
     Linux single instance implementation using file locking.
     
-    Uses fcntl.lockf for file-based process locking.
+    Uses fcntl.flock on an O_CLOEXEC descriptor: the lock is not inherited
+    by launched apps and the kernel drops it when the process dies, so a
+    crash never leaves a stale lock behind.
+    
+    The lock file lives in the per-user $XDG_RUNTIME_DIR when available
+    (falling back to /tmp), so other users can't pre-create or hold it.
     """
     
-    def __init__(self, lock_file: str = "/tmp/fadcrypt.lock"):
+    def __init__(self, lock_file: Optional[str] = None):
         """
         Initialize Linux single instance manager.
         
         Args:
-            lock_file: Path to lock file
+            lock_file: Path to lock file (default: fadcrypt.lock in
+                       $XDG_RUNTIME_DIR, or /tmp if it isn't set)
         """
+        if lock_file is None:
+            runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+            lock_file = os.path.join(runtime_dir, 'fadcrypt.lock')
         self.lock_file = lock_file
         self.lock_fd = None
         
@@ -129,40 +139,24 @@ class SingleInstanceLinux(SingleInstanceBase):
         """
         try:
             import fcntl
-            import psutil
-            
-            # Check if lock file exists and contains a stale PID
-            if os.path.exists(self.lock_file):
-                try:
-                    with open(self.lock_file, 'r') as f:
-                        pid_str = f.read().strip()
-                        if pid_str:
-                            pid = int(pid_str)
-                            # Check if process with this PID exists
-                            if not psutil.pid_exists(pid):
-                                # Stale lock file - remove it
-                                print(f"🧹 Removing stale lock file (process {pid} no longer exists)")
-                                os.remove(self.lock_file)
-                except Exception as e:
-                    print(f"Warning: Could not check stale lock: {e}")
             
-            # Open lock file
-            self.lock_fd = open(self.lock_file, 'w')
+            # No O_TRUNC: the file must not be clobbered before we own the lock
+            self.lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o600)
             
             # Try to acquire exclusive lock (non-blocking)
-            fcntl.lockf(self.lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(self.lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
             
-            # Write PID to lock file
-            self.lock_fd.write(str(os.getpid()))
-            self.lock_fd.flush()
+            # Write PID to lock file (unbuffered, single write)
+            os.ftruncate(self.lock_fd, 0)
+            os.write(self.lock_fd, str(os.getpid()).encode())
             
             print(f"✅ Single instance lock acquired (Linux file lock: {self.lock_file})")
             return True
             
         except (IOError, OSError) as e:
             print(f"⚠️  Another instance of FadCrypt is already running (lock file: {self.lock_file})")
-            if self.lock_fd:
-                self.lock_fd.close()
+            if self.lock_fd is not None:
+                os.close(self.lock_fd)
                 self.lock_fd = None
             return False
         except Exception as e:
@@ -172,13 +166,13 @@ class SingleInstanceLinux(SingleInstanceBase):
     def release_lock(self):
         """Release file lock on Linux."""
         try:
-            if self.lock_fd:
-                self.lock_fd.close()
+            if self.lock_fd is not None:
+                # Closing drops the flock. The file itself is left in place:
+                # unlinking it would let a new instance lock a fresh inode
+                # while another process still holds (or waits on) the old one
+                os.close(self.lock_fd)
                 self.lock_fd = None
-            
-            if os.path.exists(self.lock_file):
-                os.remove(self.lock_file)
-                print(f"✅ Single instance lock released (removed {self.lock_file})")
+                print(f"✅ Single instance lock released ({self.lock_file})")
         except Exception as e:
             print(f"❌ Error releasing Linux lock: {e}")
     
@@ -189,13 +183,18 @@ class SingleInstanceLinux(SingleInstanceBase):
         
         try:
             import fcntl
-            # Try to open and lock the file
-            with open(self.lock_file, 'r') as f:
-                fcntl.lockf(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
-                fcntl.lockf(f, fcntl.LOCK_UN)
-                return False  # Lock available, no instance running
+            # Try to lock the file (flock - must match acquire_lock)
+            fd = os.open(self.lock_file, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
+            return False
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            return False  # Lock available, no instance running
         except (IOError, OSError):
             return True  # Lock held, another instance running
+        finally:
+            os.close(fd)
 
 
 def get_single_instance_manager() -> SingleInstanceBase:
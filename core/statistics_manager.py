@@ -97,7 +97,7 @@ class StatisticsManager:
         
         events = []
         try:
-            with open(self.activity_log_file, 'r') as f:
+            with open(self.activity_log_file, 'r', encoding='utf-8') as f:
                 for line in f:
                     if line.strip():
                         events.append(json.loads(line))
@@ -19,12 +19,48 @@ Usage:
 """
 
 import os
+import re
+import shlex
 import time
 import threading
 import psutil
 from typing import List, Dict, Callable, Set, Optional
 
 
+_EXEC_RE = re.compile(rb'^Exec=(.+)$', re.MULTILINE)
+
+# Chromium-based browsers that must never be matched as Google Chrome
+_NON_CHROME_BROWSERS = ('brave', 'edge', 'chromium', 'opera', 'vivaldi')
+
+
+def get_exec_from_desktop(desktop_path: str) -> str:
+    """
+    Extract the executable name from a .desktop file's Exec= line.
+    
+    Args:
+        desktop_path: Path to the .desktop file
+        
+    Returns:
+        Executable basename, or the .desktop file's basename if none is found
+    """
+    try:
+        with open(desktop_path, 'rb') as f:
+            match = _EXEC_RE.search(f.read())
+        if match:
+            exec_line = match.group(1).decode('utf-8', errors='replace').strip()
+            # shlex is only needed when the line actually uses quoting
+            if '"' in exec_line or "'" in exec_line or '\\' in exec_line:
+                parts = shlex.split(exec_line)
+            else:
+                parts = exec_line.split()
+            # Skip an "env" wrapper and its VAR=value assignments
+            executable = next((part for part in parts if '=' not in part and part != 'env'), '')
+            return executable.rsplit('/', 1)[-1]
+    except (OSError, ValueError) as e:
+        print(f"[MONITOR] Error parsing desktop file {desktop_path}: {e}")
+    return os.path.basename(desktop_path)
+
+
 class UnifiedMonitor:
     """
     Single-threaded application monitoring system.
@@ -170,13 +206,18 @@ class UnifiedMonitor:
             if 'google-chrome' in app_path.lower() or process_name.lower() == 'chrome':
                 is_chrome_app = True
             # Don't treat Brave, Edge, Chromium, etc. as Chrome - they have separate processes
-            elif any(x in app_path.lower() for x in ['brave', 'edge', 'chromium', 'opera', 'vivaldi']):
+            elif any(x in app_path.lower() for x in _NON_CHROME_BROWSERS):
                 is_chrome_app = False
             
+            # Everything the per-cycle matcher needs is derived here once,
+            # since an app's path never changes while it is being monitored
+            process_name = process_name.lower()
             app_monitors.append({
                 'name': app_name,
                 'path': app_path,
-                'process_name': process_name.lower(),
+                'path_lower': app_path.lower(),
+                'process_name': process_name,
+                'process_pattern': re.compile(r'\b' + re.escape(process_name) + r'\b'),
                 'is_chrome': is_chrome_app,
                 'no_process_count': 0
             })
@@ -229,8 +270,9 @@ class UnifiedMonitor:
             List of matching Process objects
         """
         app_processes = []
-        process_name = monitor['process_name'].lower()
-        app_path = monitor.get('path', '').lower()
+        process_name = monitor['process_name']
+        process_pattern = monitor['process_pattern']
+        app_path = monitor['path_lower']
         is_chrome = monitor['is_chrome']
         
         # Direct name match
@@ -251,8 +293,7 @@ class UnifiedMonitor:
                             if is_chrome and 'chrome' in pname:
                                 # CRITICAL: Don't match Brave, Edge, or other Chromium browsers
                                 # Check if process belongs to brave, microsoft-edge, chromium, etc.
-                                cmd = ' '.join(proc.cmdline()) if hasattr(proc, 'cmdline') else ''
-                                if any(browser in cmd.lower() for browser in ['brave', 'edge', 'chromium', 'opera', 'vivaldi']):
+                                if any(browser in cmdline_str for browser in _NON_CHROME_BROWSERS):
                                     continue  # Skip non-Chrome browsers
                                 
                                 app_processes.extend(procs)
@@ -260,11 +301,9 @@ class UnifiedMonitor:
                             
                             # For non-Chrome apps: STRICT matching to avoid false positives
                             # Special handling for "env" path apps - match by process_name only
-                            elif app_path and app_path.lower() == "env":
+                            elif app_path == "env":
                                 # "env" means find in PATH - match by process_name using word boundaries
-                                import re
-                                pattern = r'\b' + re.escape(process_name) + r'\b'
-                                if re.search(pattern, cmdline_str):
+                                if process_pattern.search(cmdline_str):
                                     app_processes.append(proc)
                             # For apps with real paths: STRICT path matching
                             elif app_path and len(app_path) >= 4:
@@ -274,10 +313,8 @@ class UnifiedMonitor:
                             # Fallback: match process_name only if it's specific enough (>= 5 chars)
                             elif len(process_name) >= 5 and process_name in cmdline_str:
                                 # Additional check: ensure it's not a substring of another word
-                                import re
-                                # Use word boundary matching
-                                pattern = r'\b' + re.escape(process_name) + r'\b'
-                                if re.search(pattern, cmdline_str):
+                                # (precompiled word boundary pattern)
+                                if process_pattern.search(cmdline_str):
                                     app_processes.append(proc)
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         continue
@@ -429,7 +466,7 @@ class UnifiedMonitor:
                 
                 # Get current state
                 state = self.get_state()
-                unlocked_apps = state.get('unlocked_apps', [])
+                unlocked_apps = state.get('unlocked_apps', set())
                 
                 # Check if any Chrome app is unlocked (they all share processes)
                 chrome_unlocked = any(
@@ -489,7 +526,7 @@ class UnifiedMonitor:
                             if self.enable_profiling:
                                 print(f"[AUTO-LOCK] {app_name} (no active processes)")
                             
-                            unlocked_apps.remove(app_name)
+                            unlocked_apps.discard(app_name)
                             self.set_state('unlocked_apps', unlocked_apps)
                             monitor['no_process_count'] = 0
                             
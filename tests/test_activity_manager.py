@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Activity Manager Test Suite
+Checks buffered flushing, tail reads and the search prefilter of the
+activity log.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.activity_manager import ActivityManager
+
+
+class ActivityManagerTestCase(unittest.TestCase):
+    """Fresh ActivityManager in a temporary config folder"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp(prefix="fadcrypt_activity_test_")
+        self.flush_calls = 0
+        self.manager = ActivityManager(self.test_dir, on_flush=self.on_flush)
+
+    def tearDown(self):
+        self.manager.close(notify=False)
+        shutil.rmtree(self.test_dir)
+
+    def on_flush(self):
+        self.flush_calls += 1
+
+    def read_log(self):
+        with open(self.manager.activity_log_file, 'rb') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+class BufferedFlushTest(ActivityManagerTestCase):
+    """Events are buffered and written in batches"""
+
+    def test_events_are_buffered_until_flush(self):
+        self.manager.log_event('lock', item_name='firefox')
+        self.assertFalse(os.path.exists(self.manager.activity_log_file))
+        self.manager.flush()
+        self.assertEqual([e['event_type'] for e in self.read_log()], ['lock'])
+        self.assertEqual(self.flush_calls, 1)
+
+    def test_threshold_flushes_immediately(self):
+        for i in range(ActivityManager.FLUSH_THRESHOLD):
+            self.manager.log_event('unlock', item_name=f'app{i}')
+        self.assertEqual(len(self.read_log()), ActivityManager.FLUSH_THRESHOLD)
+
+    def test_empty_flush_does_not_notify(self):
+        self.manager.flush()
+        self.assertEqual(self.flush_calls, 0)
+
+    def test_notify_false_skips_callback(self):
+        # atexit path: events reach the disk, the callback is not called
+        self.manager.log_event('lock', item_name='firefox')
+        self.manager.close(notify=False)
+        self.assertEqual(len(self.read_log()), 1)
+        self.assertEqual(self.flush_calls, 0)
+
+    def test_optional_fields_and_extras(self):
+        self.manager.log_event('unlock', item_name='vlc', item_type='application',
+                               unlock_method='password', pid=42, skipped=None)
+        self.manager.flush()
+        event = self.read_log()[0]
+        self.assertEqual(event['item_name'], 'vlc')
+        self.assertEqual(event['pid'], 42)
+        self.assertTrue(event['success'])
+        self.assertNotIn('details', event)
+        self.assertNotIn('skipped', event)
+
+    def test_log_reopened_after_deletion(self):
+        self.manager.log_event('lock')
+        self.manager.flush()
+        os.remove(self.manager.activity_log_file)
+        self.manager.log_event('unlock')
+        self.manager.flush()
+        self.assertEqual([e['event_type'] for e in self.read_log()], ['unlock'])
+
+
+class TailReadTest(ActivityManagerTestCase):
+    """get_recent_events reads the end of the log"""
+
+    def test_recent_events_in_order(self):
+        for i in range(10):
+            self.manager.log_event('lock', item_name=f'app{i}')
+        names = [e['item_name'] for e in self.manager.get_recent_events(limit=3)]
+        self.assertEqual(names, ['app7', 'app8', 'app9'])
+
+    def test_tail_across_block_boundaries(self):
+        for i in range(200):
+            self.manager.log_event('lock', item_name=f'app{i}', details='x' * 50)
+        self.manager.flush()
+        lines = self.manager._tail_lines(150, block_size=64)
+        self.assertEqual(len(lines), 150)
+        self.assertEqual(json.loads(lines[0])['item_name'], 'app50')
+        self.assertEqual(json.loads(lines[-1])['item_name'], 'app199')
+
+    def test_limit_larger_than_log(self):
+        self.manager.log_event('lock', item_name='only')
+        self.assertEqual(len(self.manager.get_recent_events(limit=50)), 1)
+
+    def test_no_log_file(self):
+        self.assertEqual(self.manager.get_recent_events(), [])
+
+
+class SearchTest(ActivityManagerTestCase):
+    """search_events and get_events_by_type filtering"""
+
+    def setUp(self):
+        super().setUp()
+        self.manager.log_event('lock', item_name='Firefox', details='locked by user')
+        self.manager.log_event('unlock', item_name='VLC', details='opened "Movie"')
+        self.manager.log_event('lock', item_name='Café', details='unicode name')
+        self.manager.log_event('failed_unlock', item_name='Slack', details='wrong password',
+                               note='firefox mentioned only in an extra field')
+
+    def test_search_is_case_insensitive(self):
+        self.assertEqual([e['item_name'] for e in self.manager.search_events('FIREFOX')], ['Firefox'])
+
+    def test_search_matches_details(self):
+        self.assertEqual([e['item_name'] for e in self.manager.search_events('wrong pass')], ['Slack'])
+
+    def test_search_queries_that_bypass_prefilter(self):
+        # Quotes are escaped and non-ASCII may be, so these can't be matched on raw bytes
+        self.assertEqual([e['item_name'] for e in self.manager.search_events('"movie"')], ['VLC'])
+        self.assertEqual([e['item_name'] for e in self.manager.search_events('café')], ['Café'])
+
+    def test_search_ignores_matches_outside_name_and_details(self):
+        self.assertEqual(self.manager.search_events('extra field'), [])
+
+    def test_events_by_type(self):
+        self.assertEqual([e['item_name'] for e in self.manager.get_events_by_type('lock')], ['Firefox', 'Café'])
+        self.assertEqual(self.manager.get_events_by_type('unlock_all'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Crypto Key Cache Test Suite
+Checks CryptoManager's derived-key cache: hits, eviction, invalidation and
+clear_keys() after a password change.
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from core.crypto_manager import CryptoManager
+except ImportError as e:  # crypto_manager needs cryptography
+    raise unittest.SkipTest(f"core.crypto_manager unavailable: {e}")
+
+
+class KeyCacheTest(unittest.TestCase):
+    """CryptoManager.derive_key caching"""
+
+    def setUp(self):
+        self.crypto = CryptoManager()
+        self.crypto.ITERATIONS = 1000  # Keep PBKDF2 cheap; caching doesn't depend on it
+        self.salt = os.urandom(CryptoManager.SALT_SIZE)
+
+    def count_derivations(self):
+        return mock.patch('core.crypto_manager.hashlib.pbkdf2_hmac', wraps=hashlib.pbkdf2_hmac)
+
+    def test_repeated_derivation_is_cached(self):
+        with self.count_derivations() as pbkdf2:
+            first = self.crypto.derive_key(b'password', self.salt)
+            second = self.crypto.derive_key(b'password', self.salt)
+        self.assertEqual(first, second)
+        self.assertEqual(pbkdf2.call_count, 1)
+
+    def test_cached_key_matches_pbkdf2(self):
+        expected = hashlib.pbkdf2_hmac('sha256', b'password', self.salt, 1000, dklen=CryptoManager.KEY_LENGTH)
+        self.assertEqual(self.crypto.derive_key(b'password', self.salt), expected)
+        self.assertEqual(self.crypto.derive_key(b'password', self.salt), expected)
+
+    def test_other_password_or_salt_is_not_served_from_cache(self):
+        key = self.crypto.derive_key(b'password', self.salt)
+        self.assertNotEqual(self.crypto.derive_key(b'other', self.salt), key)
+        self.assertNotEqual(self.crypto.derive_key(b'password', os.urandom(CryptoManager.SALT_SIZE)), key)
+
+    def test_passwords_are_not_stored_in_cache(self):
+        self.crypto.derive_key(b'secret-password', self.salt)
+        for digest, salt in self.crypto._key_cache:
+            self.assertNotIn(b'secret-password', digest)
+
+    def test_cache_is_bounded_and_evicts_oldest(self):
+        salts = [os.urandom(CryptoManager.SALT_SIZE) for _ in range(CryptoManager.KEY_CACHE_SIZE + 1)]
+        for salt in salts:
+            self.crypto.derive_key(b'password', salt)
+        self.assertEqual(len(self.crypto._key_cache), CryptoManager.KEY_CACHE_SIZE)
+        with self.count_derivations() as pbkdf2:
+            self.crypto.derive_key(b'password', salts[-1])  # Newest: still cached
+            self.assertEqual(pbkdf2.call_count, 0)
+            self.crypto.derive_key(b'password', salts[0])  # Oldest: evicted
+            self.assertEqual(pbkdf2.call_count, 1)
+
+    def test_clear_keys_forces_rederivation(self):
+        self.crypto.derive_key(b'password', self.salt)
+        self.crypto.clear_keys()
+        self.assertEqual(self.crypto._key_cache, {})
+        with self.count_derivations() as pbkdf2:
+            self.crypto.derive_key(b'password', self.salt)
+        self.assertEqual(pbkdf2.call_count, 1)
+
+    def test_cache_is_per_instance(self):
+        self.crypto.derive_key(b'password', self.salt)
+        other = CryptoManager()
+        self.assertEqual(other._key_cache, {})
+        self.assertNotEqual(other._key_cache_secret, self.crypto._key_cache_secret)
+
+
+class PasswordChangeTest(unittest.TestCase):
+    """Encrypted files after a password change and clear_keys()"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp(prefix="fadcrypt_key_cache_test_")
+        self.file_path = os.path.join(self.test_dir, "data.bin")
+        self.crypto = CryptoManager()
+        self.crypto.ITERATIONS = 1000
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_old_password_rejected_after_change(self):
+        data = {'apps': ['firefox']}
+        self.assertTrue(self.crypto.encrypt_data(b'old-password', data, self.file_path))
+        self.assertEqual(self.crypto.decrypt_data(b'old-password', self.file_path), data)
+
+        # What PasswordManager.change_password does: re-encrypt, then drop cached keys
+        self.assertTrue(self.crypto.encrypt_data(b'new-password', data, self.file_path))
+        self.crypto.clear_keys()
+
+        self.assertIsNone(self.crypto.decrypt_data(b'old-password', self.file_path, suppress_errors=True))
+        self.assertEqual(self.crypto.decrypt_data(b'new-password', self.file_path), data)
+
+
+if __name__ == '__main__':
+    unittest.main()
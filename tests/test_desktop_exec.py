@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Desktop Exec Parsing Test Suite
+Checks that get_exec_from_desktop extracts the executable from Exec= lines.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from core.unified_monitor import get_exec_from_desktop
+except ImportError as e:  # unified_monitor needs psutil
+    raise unittest.SkipTest(f"core.unified_monitor unavailable: {e}")
+
+
+class GetExecFromDesktopTest(unittest.TestCase):
+    """get_exec_from_desktop parsing"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp(prefix="fadcrypt_desktop_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def resolve(self, exec_line: str, name: str = 'app.desktop') -> str:
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"[Desktop Entry]\nName=App\nExec={exec_line}\nIcon=app\n")
+        return get_exec_from_desktop(path)
+
+    def test_plain_executable_and_field_codes(self):
+        self.assertEqual(self.resolve('/usr/bin/gimp %U'), 'gimp')
+        self.assertEqual(self.resolve('firefox %u'), 'firefox')
+
+    def test_tryexec_line_ignored(self):
+        self.assertEqual(self.resolve('/usr/bin/vlc --started-from-file %U\nTryExec=/usr/bin/vlc'), 'vlc')
+
+    def test_quoted_path_with_spaces(self):
+        self.assertEqual(self.resolve('"/opt/My App/my-app" --flag %F'), 'my-app')
+
+    def test_env_assignments_skipped(self):
+        self.assertEqual(self.resolve('env GDK_BACKEND=x11 FOO=1 /usr/bin/slack %U'), 'slack')
+
+    def test_missing_exec_falls_back_to_file_name(self):
+        path = os.path.join(self.test_dir, 'noexec.desktop')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("[Desktop Entry]\nName=App\n")
+        self.assertEqual(get_exec_from_desktop(path), 'noexec.desktop')
+
+
+if __name__ == '__main__':
+    unittest.main()
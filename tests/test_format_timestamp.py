@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+format_timestamp Test Suite
+Checks the '24th Aug 2025 02:24 PM' format built without strftime.
+"""
+
+import os
+import sys
+import unittest
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from core.application_manager import format_timestamp
+except ImportError as e:  # application_manager needs tkinter and Pillow
+    raise unittest.SkipTest(f"core.application_manager unavailable: {e}")
+
+
+def local_ts(*args) -> float:
+    """Epoch seconds for a local date/time"""
+    return datetime(*args).timestamp()
+
+
+class FormatTimestampTest(unittest.TestCase):
+    """format_timestamp output format"""
+
+    def test_documented_example(self):
+        self.assertEqual(format_timestamp(local_ts(2025, 8, 24, 14, 24)), "24th Aug 2025 02:24 PM")
+
+    def test_hour_is_zero_padded_12_hour_clock(self):
+        self.assertEqual(format_timestamp(local_ts(2025, 1, 5, 9, 5)), "5th Jan 2025 09:05 AM")
+        self.assertEqual(format_timestamp(local_ts(2025, 1, 5, 0, 0)), "5th Jan 2025 12:00 AM")
+        self.assertEqual(format_timestamp(local_ts(2025, 1, 5, 12, 0)), "5th Jan 2025 12:00 PM")
+        self.assertEqual(format_timestamp(local_ts(2025, 1, 5, 23, 59)), "5th Jan 2025 11:59 PM")
+
+    def test_months_are_english_abbreviations(self):
+        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                  'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+        for month, abbr in enumerate(months, start=1):
+            with self.subTest(month=month):
+                self.assertEqual(format_timestamp(local_ts(2024, month, 10, 8, 0)),
+                                 f"10th {abbr} 2024 08:00 AM")
+
+    def test_ordinal_suffixes(self):
+        expected = {1: '1st', 2: '2nd', 3: '3rd', 4: '4th', 11: '11th', 12: '12th',
+                    13: '13th', 20: '20th', 21: '21st', 22: '22nd', 23: '23rd',
+                    24: '24th', 30: '30th', 31: '31st'}
+        for day, ordinal in expected.items():
+            with self.subTest(day=day):
+                self.assertTrue(format_timestamp(local_ts(2025, 3, day, 10, 0)).startswith(ordinal + ' '))
+
+    def test_seconds_within_a_minute_share_a_result(self):
+        start = local_ts(2025, 8, 24, 14, 24)
+        self.assertEqual(format_timestamp(start), format_timestamp(start + 59.9))
+        self.assertNotEqual(format_timestamp(start), format_timestamp(start + 60))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Launch Strategy Test Suite
+Checks how classify_launch_strategy picks the way an unlocked app is started.
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from ui.base.main_window_base import classify_launch_strategy
+except ImportError as e:  # main_window_base needs PyQt6
+    raise unittest.SkipTest(f"ui.base.main_window_base unavailable: {e}")
+
+
+class ClassifyLaunchStrategyTest(unittest.TestCase):
+    """classify_launch_strategy decisions"""
+
+    def test_desktop_files_use_xdg_open(self):
+        self.assertEqual(classify_launch_strategy('Files', '/usr/share/applications/org.gnome.Nautilus.desktop'), 'desktop')
+        self.assertEqual(classify_launch_strategy('Tool', '/home/u/Tool.DESKTOP'), 'desktop')
+
+    def test_python_scripts_use_interpreter(self):
+        self.assertEqual(classify_launch_strategy('Script', '/opt/tools/run.py'), 'python')
+
+    def test_known_gui_apps_run_directly(self):
+        # In a CLI bin dir, but known GUI apps must not be put in a terminal
+        self.assertEqual(classify_launch_strategy('Firefox', '/usr/bin/firefox'), 'direct')
+        self.assertEqual(classify_launch_strategy('GIMP', '/usr/bin/gimp-2.10'), 'direct')
+
+    def test_gui_app_matched_by_name(self):
+        self.assertEqual(classify_launch_strategy('Visual Studio Code', '/usr/bin/vsc-launcher'), 'direct')
+
+    def test_cli_tools_open_in_terminal(self):
+        self.assertEqual(classify_launch_strategy('htop', '/usr/bin/htop'), 'terminal')
+        self.assertEqual(classify_launch_strategy('mytool', '/usr/local/bin/mytool'), 'terminal')
+
+    def test_other_paths_run_directly(self):
+        self.assertEqual(classify_launch_strategy('App', '/opt/app/app'), 'direct')
+        self.assertEqual(classify_launch_strategy('App', 'C:\\Program Files\\App\\app.exe'), 'direct')
+
+
+if __name__ == '__main__':
+    unittest.main()
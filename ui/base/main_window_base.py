@@ -32,6 +32,74 @@ from core.file_protection import get_file_protection_manager
 from version import __version__, __version_code__
 
 
+# Known GUI applications - launched directly instead of inside a terminal
+GUI_APPS = frozenset({
+    'chrome', 'chromium', 'firefox', 'brave', 'opera', 'edge',
+    'vivaldi', 'code', 'slack', 'discord', 'telegram',
+    'vlc', 'gimp', 'libreoffice', 'thunderbird', 'zoom', 'teams',
+    'obs', 'steam', 'nautilus', 'dolphin', 'kate', 'gedit',
+    'kdenlive', 'krita', 'inkscape', 'blender', 'audacity',
+    'shotcut', 'pycharm', 'eclipse', 'intellij', 'sublime',
+    'virtualbox', 'postman', 'docker', 'filezilla', 'wireshark',
+    'gparted', 'transmission', 'remmina',
+})
+
+_CLI_BIN_DIRS = ('/usr/bin', '/bin', '/usr/local/bin')
+
+
+def _spawn_detached(argv):
+    """
+    Start argv in a new session with stdout/stderr sent to /dev/null.
+    
+    Uses os.posix_spawnp where available so the (large) Qt process is not
+    fork()ed just to exec the app; falls back to subprocess.Popen otherwise.
+    """
+    import subprocess
+    import threading
+    
+    if hasattr(os, 'posix_spawnp') and hasattr(os, 'POSIX_SPAWN_OPEN'):
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ]
+        try:
+            pid = os.posix_spawnp(argv[0], argv, os.environ,
+                                  file_actions=file_actions, setsid=True)
+        except (NotImplementedError, TypeError):
+            # setsid unsupported by this libc - use the portable path below
+            pass
+        else:
+            # Reap the child when it exits so it doesn't linger as a zombie
+            threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+            return
+    
+    subprocess.Popen(argv,
+                     stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+
+
+def classify_launch_strategy(app_name: str, app_path: str) -> str:
+    """
+    Decide how an application is launched after it is unlocked.
+    
+    Returns:
+        'desktop' (xdg-open), 'python' (interpreter), 'terminal' (CLI tool
+        inside a terminal) or 'direct' (exec the path itself)
+    """
+    path_lower = app_path.lower()
+    if path_lower.endswith('.desktop'):
+        return 'desktop'
+    if path_lower.endswith('.py'):
+        return 'python'
+    name_lower = app_name.lower()
+    if any(gui_app in path_lower or gui_app in name_lower for gui_app in GUI_APPS):
+        return 'direct'
+    if any(bin_dir in app_path for bin_dir in _CLI_BIN_DIRS):
+        return 'terminal'
+    return 'direct'
+
+
 class JsonSyntaxHighlighter(QSyntaxHighlighter):
     """Syntax highlighter for JSON with dark theme colors"""
     
@@ -121,6 +189,7 @@ class MainWindowBase(QMainWindow):
     # Class-level signal for thread-safe password prompts
     password_prompt_requested = pyqtSignal(str, str)
     file_access_requested = pyqtSignal(str)  # Signal for file access from background thread
+    activity_flushed = pyqtSignal()  # Emitted from the activity log's flush thread
     
     def __init__(self, version=None):
         super().__init__()
@@ -178,12 +247,20 @@ class MainWindowBase(QMainWindow):
         self.app_manager = None
         
         # Activity and Statistics managers
-        self.activity_manager = ActivityManager(fadcrypt_folder)
+        # Tray stats are refreshed once per batch of events written to disk.
+        # Flushes can happen on a timer thread, so the refresh is queued onto the GUI thread
+        self.activity_flushed.connect(self.update_tray_stats_display, Qt.ConnectionType.QueuedConnection)
+        self.activity_manager = ActivityManager(fadcrypt_folder, on_flush=self.activity_flushed.emit)
+        QApplication.instance().aboutToQuit.connect(self.activity_manager.close)
         self.statistics_manager = StatisticsManager(fadcrypt_folder)
         
         # Stats window (created on demand)
         self.stats_window = None
         
+        # app_name -> (app_path, launch strategy), refreshed whenever the
+        # applications config is loaded or saved
+        self._launch_strategies = {}
+        
         # Monitoring state
         self.monitoring_active = False
         self.unified_monitor = None
@@ -199,7 +276,7 @@ class MainWindowBase(QMainWindow):
         # Initialize UI
         # Initialize monitoring state
         self.monitoring_state = {
-            'unlocked_apps': []
+            'unlocked_apps': set()
         }
         self.load_monitoring_state()
         
@@ -1578,7 +1655,7 @@ class MainWindowBase(QMainWindow):
             
             # Reset monitoring state
             self.monitoring_state = {
-                'unlocked_apps': [],
+                'unlocked_apps': set(),
                 'unlocked_files': []
             }
             self.save_monitoring_state_to_disk()
@@ -2155,6 +2232,13 @@ class MainWindowBase(QMainWindow):
         status = "locked" if is_locked else "unlocked"
         self.show_message("Success", f"Application '{app_name}' is now {status}.", "success")
     
+    def _refresh_launch_strategies(self):
+        """Precompute the launch strategy of every configured application"""
+        self._launch_strategies = {
+            app_name: (app_data['path'], classify_launch_strategy(app_name, app_data['path']))
+            for app_name, app_data in self.app_list_widget.apps_data.items()
+        }
+    
     def save_applications_config(self):
         """Save applications configuration to unified JSON file"""
         config_file = os.path.join(self.get_fadcrypt_folder(), 'apps_config.json')
@@ -2195,6 +2279,8 @@ class MainWindowBase(QMainWindow):
                 'added_at': added_at
             })
         
+        self._refresh_launch_strategies()
+        
         # Create unified config - preserve locked items
         unified_config = {
             'applications': applications,
@@ -2274,6 +2360,7 @@ class MainWindowBase(QMainWindow):
                     added_at=added_at
                 )
             
+            self._refresh_launch_strategies()
             self.update_app_count()
             print(f"Applications config loaded: {len(apps_list)} apps")
             
@@ -2677,10 +2764,29 @@ class MainWindowBase(QMainWindow):
         self.save_monitoring_state()
         print(f"💾 State saved: {key} = {value}")
     
-    def save_monitoring_state(self):
-        """Save monitoring state to JSON file"""
-        import json
+    def _write_monitoring_state(self) -> bool:
+        """
+        Write monitoring state to disk, skipping the write if unchanged.
+        
+        unlocked_apps is kept as a set in memory and stored as a sorted list.
+        
+        Returns:
+            bool: True if the file was rewritten, False if it was already up to date
+        """
         state_file = os.path.join(self.get_fadcrypt_folder(), 'monitoring_state.json')
+        payload = json.dumps(
+            {**self.monitoring_state,
+             'unlocked_apps': sorted(self.monitoring_state.get('unlocked_apps', ()))},
+            indent=4
+        )
+        
+        # Avoid the unlock/write/relock cycle (and a file monitor event) for no-ops
+        try:
+            with open(state_file, 'r') as f:
+                if f.read() == payload:
+                    return False
+        except OSError:
+            pass
         
         # Temporarily unlock config file if locked (for writing)
         if self.file_lock_manager and hasattr(self.file_lock_manager, 'temporarily_unlock_config'):
@@ -2688,14 +2794,20 @@ class MainWindowBase(QMainWindow):
         
         try:
             with open(state_file, 'w') as f:
-                json.dump(self.monitoring_state, f, indent=4)
-        except Exception as e:
-            print(f"Error saving monitoring state: {e}")
+                f.write(payload)
+            return True
         finally:
             # Re-lock config file if monitoring is active
             if self.monitoring_active and self.file_lock_manager and hasattr(self.file_lock_manager, 'relock_config'):
                 self.file_lock_manager.relock_config('monitoring_state.json')
     
+    def save_monitoring_state(self):
+        """Save monitoring state to JSON file"""
+        try:
+            self._write_monitoring_state()
+        except Exception as e:
+            print(f"Error saving monitoring state: {e}")
+    
     def load_monitoring_state(self):
         """Load monitoring state from JSON file"""
         import json
@@ -2704,12 +2816,14 @@ class MainWindowBase(QMainWindow):
             if os.path.exists(state_file):
                 with open(state_file, 'r') as f:
                     self.monitoring_state = json.load(f)
-                    print(f"Loaded monitoring state: {len(self.monitoring_state.get('unlocked_apps', []))} unlocked apps")
+                    # Set in memory for O(1) membership checks in the monitor loop
+                    self.monitoring_state['unlocked_apps'] = set(self.monitoring_state.get('unlocked_apps', []))
+                    print(f"Loaded monitoring state: {len(self.monitoring_state['unlocked_apps'])} unlocked apps")
             else:
-                self.monitoring_state = {'unlocked_apps': []}
+                self.monitoring_state = {'unlocked_apps': set()}
         except Exception as e:
             print(f"Error loading monitoring state: {e}")
-            self.monitoring_state = {'unlocked_apps': []}
+            self.monitoring_state = {'unlocked_apps': set()}
     
     def _handle_file_access_attempt_threadsafe(self, file_path: str) -> bool:
         """
@@ -2923,26 +3037,14 @@ class MainWindowBase(QMainWindow):
     
     def save_monitoring_state_to_disk(self):
         """Save monitoring state to JSON file including monitoring_active flag"""
-        import json
-        state_file = os.path.join(self.get_fadcrypt_folder(), 'monitoring_state.json')
-        
-        # Temporarily unlock config file if locked (for writing)
-        if self.file_lock_manager and hasattr(self.file_lock_manager, 'temporarily_unlock_config'):
-            self.file_lock_manager.temporarily_unlock_config('monitoring_state.json')
-        
         try:
             # Add monitoring_active flag
             self.monitoring_state['monitoring_active'] = self.monitoring_active
             
-            with open(state_file, 'w') as f:
-                json.dump(self.monitoring_state, f, indent=2)
-            print(f"💾 Saved monitoring state: active={self.monitoring_active}")
+            if self._write_monitoring_state():
+                print(f"💾 Saved monitoring state: active={self.monitoring_active}")
         except Exception as e:
             print(f"❌ Error saving monitoring state: {e}")
-        finally:
-            # Re-lock config file if monitoring is active
-            if self.monitoring_active and self.file_lock_manager and hasattr(self.file_lock_manager, 'relock_config'):
-                self.file_lock_manager.relock_config('monitoring_state.json')
     
     def check_crash_recovery(self):
         """
@@ -3067,54 +3169,30 @@ class MainWindowBase(QMainWindow):
         try:
             print(f"🚀 Launching {app_name}...")
             
-            # Determine if it's a known GUI app
-            gui_apps = ['chrome', 'chromium', 'firefox', 'brave', 'opera', 'edge', 
-                       'vivaldi', 'code', 'slack', 'discord', 'telegram',
-                       'vlc', 'gimp', 'libreoffice', 'thunderbird', 'zoom', 'teams', 
-                       'obs', 'steam', 'nautilus', 'dolphin', 'kate', 'gedit', 
-                       'kdenlive', 'krita', 'inkscape', 'blender', 'audacity', 
-                       'shotcut', 'pycharm', 'eclipse', 'intellij', 'sublime', 
-                       'virtualbox', 'postman', 'docker', 'filezilla', 'wireshark', 
-                       'gparted', 'transmission', 'remmina']
-            
-            is_gui_app = any(gui_app in app_path.lower() or gui_app in app_name.lower() 
-                            for gui_app in gui_apps)
+            # Strategy is precomputed when the config is loaded/saved
+            cached = self._launch_strategies.get(app_name)
+            if cached and cached[0] == app_path:
+                strategy = cached[1]
+            else:
+                strategy = classify_launch_strategy(app_name, app_path)
             
             if platform.system() == "Linux":
                 # Linux launch logic
-                if app_path.lower().endswith('.desktop'):
+                if strategy == 'desktop':
                     # Launch .desktop files with xdg-open
-                    subprocess.Popen(['xdg-open', app_path], 
-                                   stdout=subprocess.DEVNULL, 
-                                   stderr=subprocess.DEVNULL,
-                                   start_new_session=True)
-                elif app_path.lower().endswith('.py'):
+                    _spawn_detached(['xdg-open', app_path])
+                elif strategy == 'python':
                     # Launch Python scripts in terminal
-                    subprocess.Popen(['gnome-terminal', '--', 'python3', app_path],
-                                   stdout=subprocess.DEVNULL, 
-                                   stderr=subprocess.DEVNULL,
-                                   start_new_session=True)
-                elif is_gui_app:
-                    # Launch GUI apps directly
-                    subprocess.Popen([app_path],
-                                   stdout=subprocess.DEVNULL, 
-                                   stderr=subprocess.DEVNULL,
-                                   start_new_session=True)
-                elif any(bin_dir in app_path for bin_dir in ['/usr/bin', '/bin', '/usr/local/bin']):
+                    _spawn_detached(['gnome-terminal', '--', 'python3', app_path])
+                elif strategy == 'terminal':
                     # Launch CLI tools in terminal
-                    subprocess.Popen(['gnome-terminal', '--', app_path],
-                                   stdout=subprocess.DEVNULL, 
-                                   stderr=subprocess.DEVNULL,
-                                   start_new_session=True)
+                    _spawn_detached(['gnome-terminal', '--', app_path])
                 else:
-                    # Launch other apps directly (assume GUI)
-                    subprocess.Popen([app_path],
-                                   stdout=subprocess.DEVNULL, 
-                                   stderr=subprocess.DEVNULL,
-                                   start_new_session=True)
+                    # Launch GUI apps and everything else directly
+                    _spawn_detached([app_path])
             else:
                 # Windows launch logic
-                if app_path.lower().endswith('.py'):
+                if strategy == 'python':
                     # Launch Python scripts
                     subprocess.Popen(['python', app_path],
                                    stdout=subprocess.DEVNULL, 
@@ -3155,9 +3233,9 @@ class MainWindowBase(QMainWindow):
             
             # Add to unlocked apps (the monitoring thread will see this and stop blocking)
             state = self.get_monitoring_state()
-            unlocked_apps = state.get('unlocked_apps', [])
+            unlocked_apps = state.get('unlocked_apps', set())
             if app_name not in unlocked_apps:
-                unlocked_apps.append(app_name)
+                unlocked_apps.add(app_name)
                 self.set_monitoring_state('unlocked_apps', unlocked_apps)
             
             # Increment unlock count
@@ -3720,10 +3798,8 @@ class MainWindowBase(QMainWindow):
                     item_type: str | None = None, **kwargs):
         """Log an activity event"""
         if self.activity_manager:
+            # Tray stats update via the activity manager's on_flush callback
             self.activity_manager.log_event(event_type, item_name, item_type, **kwargs)
-        
-        # Update tray stats after logging
-        self.update_tray_stats_display()
     
     def update_tray_stats_display(self):
         """Update system tray with live protection stats"""
@@ -4,7 +4,6 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QComboBox, QPushButton, QTableWidget, QTableWidgetItem
 )
-from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
 
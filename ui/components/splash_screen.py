@@ -1,7 +1,7 @@
 """Splash Screen for FadCrypt"""
 
 from PyQt6.QtWidgets import QSplashScreen, QApplication
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QPixmap, QColor, QPainter
 import os
 
@@ -13,6 +13,9 @@ class FadCryptSplashScreen(QSplashScreen):
     This fixes Wayland centering issues by making the splash truly fullscreen.
     """
     
+    # Emitted once the splash has been closed; the main window is shown from here
+    finished = pyqtSignal()
+    
     def __init__(self, resource_path_func):
         """
         Initialize splash screen.
@@ -159,18 +162,17 @@ class FadCryptSplashScreen(QSplashScreen):
         self.update()  # Trigger repaint to show message
         QApplication.processEvents()
     
-    def close_splash(self, main_window, delay_ms=2500):
+    def close_splash(self, delay_ms=2500):
         """
-        Close splash screen and show main window.
+        Close splash screen after a minimum display time and emit `finished`.
         
         Args:
-            main_window: Main window to show after splash
             delay_ms: Minimum display time in milliseconds (default: 2500ms = 2.5 seconds)
                      This ensures the splash is visible but doesn't slow down startup too much
         """
         def finish_splash():
-            self.finish(main_window)
+            self.close()
             print("[SplashScreen] Closed after minimum display time")
+            self.finished.emit()
         
         QTimer.singleShot(delay_ms, finish_splash)
-
@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (
     QLineEdit, QPushButton, QFileDialog, QMessageBox,
     QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QFont
 import os
 import sys
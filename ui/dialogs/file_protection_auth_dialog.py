@@ -5,7 +5,6 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QFrame
 )
-from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon
 
 
@@ -2,10 +2,34 @@
 
 import os
 import subprocess
+from collections import defaultdict
 from PyQt6.QtWidgets import QMessageBox
 from ui.base.main_window_base import MainWindowBase
 
 
+def _existing_paths(paths):
+    """
+    Return the subset of paths that exist, reading each parent directory once.
+    
+    The tool lists almost all live in /usr/bin, so one os.scandir replaces a
+    stat() per tool.
+    """
+    by_dir = defaultdict(set)
+    for path in paths:
+        if path:
+            directory, name = os.path.split(path)
+            by_dir[directory].add(name)
+    
+    existing = set()
+    for directory, names in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                existing.update(os.path.join(directory, entry.name) for entry in entries if entry.name in names)
+        except OSError:
+            continue
+    return existing
+
+
 class MainWindowLinux(MainWindowBase):
     """
     Linux-specific main window extending MainWindowBase.
@@ -263,27 +287,25 @@ X-GNOME-Autostart-enabled=true
             
             # First try to read from the tracking file
             disabled_tools_file = os.path.join(self.get_fadcrypt_folder(), 'disabled_tools.txt')
-            tools_to_enable = []
+            tools_to_enable = set()
             
             if os.path.exists(disabled_tools_file):
                 with open(disabled_tools_file, 'r') as f:
-                    tools_to_enable = [tool.strip() for tool in f.read().strip().split('\n') if tool.strip()]
+                    # Set - the file can accumulate duplicates across sessions
+                    tools_to_enable = {tool.strip() for tool in f if tool.strip()}
             
             # If no tracking file, try to re-enable all common tools
             if not tools_to_enable:
-                tools_to_enable = [
+                tools_to_enable = {
                     '/usr/bin/gnome-terminal',
                     '/usr/bin/konsole',
                     '/usr/bin/xterm',
                     '/usr/bin/gnome-system-monitor',
                     '/usr/bin/htop',
                     '/usr/bin/top'
-                ]
+                }
 
-            valid_tools = []
-            for tool in tools_to_enable:
-                if tool and os.path.exists(tool):
-                    valid_tools.append(tool)
+            valid_tools = sorted(_existing_paths(tools_to_enable))
 
             if valid_tools:
                 # Use elevated daemon to restore permissions